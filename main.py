@@ -12,8 +12,8 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QDialog, QFormLayout, QFileDialog, QDialogButtonBox,
                              QStackedWidget, QTextEdit)
 from stats import PrinterMonitor
-from vidstream import VideoStreamer
-from PyQt5.QtCore import Qt, QTimer, pyqtSlot, pyqtSignal
+from vidstream import VideoStreamer, resize_to_fit
+from PyQt5.QtCore import Qt, QTimer, QEvent, pyqtSlot, pyqtSignal
 from PyQt5.QtGui import QImage, QPixmap, QColor, QPainter, QIcon, QFontMetrics
 import cv2  # Add this import here
 import numpy as np
@@ -27,9 +27,16 @@ import importlib.util
 import json
 import logging
 import time
+from contextlib import contextmanager
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 
+# orjson is optional; fall back to the stdlib json module when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Check required packages before importing
 
 
@@ -43,23 +50,10 @@ def check_and_install_dependencies():
         'requests': 'requests'  # Add this line
     }
 
-    missing_packages = []
-
-    for package, module_name in required_packages.items():
-        if module_name == 'cv2':
-            # Special check for OpenCV since module name differs from package name
-            if importlib.util.find_spec("cv2") is None:
-                missing_packages.append(package)
-        elif module_name == 'websocket':
-            # Special check for websocket-client
-            try:
-                import websocket
-            except ImportError:
-                missing_packages.append(package)
-        else:
-            # Standard check for other packages
-            if importlib.util.find_spec(module_name) is None:
-                missing_packages.append(package)
+    # Module names differ from package names (e.g. cv2, websocket); find_spec
+    # locates them without paying for the import
+    missing_packages = [package for package, module_name in required_packages.items()
+                        if importlib.util.find_spec(module_name) is None]
 
     # Install missing packages
     if missing_packages:
@@ -98,6 +92,31 @@ logger = logging.getLogger("streamy")
 # Config file for saving settings
 CONFIG_FILE = "streamy_config.json"
 
+# Video display timer interval (~30 FPS)
+FRAME_INTERVAL_MS = 33
+
+# QImage format that reads OpenCV's BGR frames directly (Qt 5.14+), else None
+QIMAGE_FORMAT_BGR888 = getattr(QImage, "Format_BGR888", None)
+
+# Interval for requesting a full printer status refresh (changes are pushed)
+STATUS_REFRESH_MS = 5000
+# Slower refresh while the printer is idle
+STATUS_REFRESH_IDLE_MS = 15000
+
+# Minimum time between printer status requests, in seconds
+STATUS_FETCH_MIN_INTERVAL = 0.3
+
+# Status label text for each printer status code (anything else is "Unknown")
+STATUS_TEXTS = {
+    0: "Status: Idle",
+    8: "Status: Idle",
+    1: "Status: Preparing to print",
+    2: "Status: Printing",
+    3: "Status: Printing",
+    4: "Status: Printing",
+    7: "Status: Finishing",
+}
+
 
 class StatusIndicator(QWidget):
     """Custom widget that displays a colored status dot"""
@@ -107,6 +126,9 @@ class StatusIndicator(QWidget):
     GREEN = QColor(60, 200, 60)     # Success/Connected
     GRAY = QColor(150, 150, 150)    # Neutral/Idle
 
+    # Pre-rendered dots shared by all indicators, keyed by (rgba, size, pixel ratio)
+    _pixmap_cache = {}
+
     def __init__(self, parent=None, color=None, size=16):
         super().__init__(parent)
         self.color = color or self.GRAY
@@ -116,30 +138,89 @@ class StatusIndicator(QWidget):
 
     def setColor(self, color):
         """Set the indicator color"""
+        if color == self.color:
+            return
         self.color = color
         self.update()
 
+    def dot_pixmap(self):
+        """Get the rendered dot for the current color, drawing it on first use"""
+        ratio = self.devicePixelRatioF()
+        key = (self.color.rgba(), self.size, ratio)
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(int(self.size * ratio), int(self.size * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+
+            # Draw circle with current color
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.color)
+            painter.drawEllipse(2, 2, self.size-4, self.size-4)
+
+            # Draw border
+            painter.setPen(QColor(80, 80, 80, 100))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawEllipse(2, 2, self.size-4, self.size-4)
+            painter.end()
+
+            self._pixmap_cache[key] = pixmap
+        return pixmap
+
     def paintEvent(self, event):
         """Paint the indicator dot"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        QPainter(self).drawPixmap(0, 0, self.dot_pixmap())
 
-        # Draw circle with current color
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(self.color)
-        painter.drawEllipse(2, 2, self.size-4, self.size-4)
 
-        # Draw border
-        painter.setPen(QColor(80, 80, 80, 100))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawEllipse(2, 2, self.size-4, self.size-4)
+class VideoLabel(QLabel):
+    """Label that paints video frames itself
+
+    QLabel.setPixmap recomputes the size hint and relayouts on every frame. This
+    keeps the current frame in an attribute and just schedules a repaint, which
+    Qt coalesces with any other pending paints. Frames are painted straight from
+    the QImage, skipping the copy QPixmap.fromImage would make.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.frame_image = None
+        self.frame_buffer = None
+
+    def setFrameImage(self, image, buffer):
+        """Set the frame to display
+
+        Args:
+            image (QImage): Frame to display
+            buffer (numpy.ndarray): Array the image wraps, kept alive while it is shown
+        """
+        self.frame_image = image
+        self.frame_buffer = buffer
+        self.update()
+
+    def paintEvent(self, event):
+        """Paint the label (border) and the current frame centered on it"""
+        super().paintEvent(event)
+        if self.frame_image is None:
+            return
+
+        rect = self.contentsRect()
+        x = rect.x() + (rect.width() - self.frame_image.width()) // 2
+        y = rect.y() + (rect.height() - self.frame_image.height()) // 2
+        QPainter(self).drawImage(x, y, self.frame_image)
 
 
 class Config:
     """Class to manage configuration settings"""
 
     def __init__(self):
+        self._batch_depth = 0
+        self._dirty = False
         self.config = self.load_config()
+        # Cached for the per-frame video path
+        self.video_enabled = self.config["video_enabled"]
 
     def load_config(self):
         """Load configuration from file"""
@@ -160,8 +241,9 @@ class Config:
 
         if os.path.exists(CONFIG_FILE):
             try:
-                with open(CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
+                with open(CONFIG_FILE, 'rb') as f:
+                    data = f.read()
+                    config = orjson.loads(data) if orjson else json.loads(data)
                     # Ensure all required keys exist
                     for key in default_config:
                         if key not in config:
@@ -174,13 +256,37 @@ class Config:
             return default_config
 
     def save_config(self):
-        """Save configuration to file"""
+        """Save configuration to file (deferred while inside a batch)"""
+        if self._batch_depth:
+            self._dirty = True
+            return
+
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.config, f)
+            if orjson:
+                data = orjson.dumps(self.config)
+            else:
+                data = json.dumps(self.config).encode("utf-8")
+
+            # Write to a temp file and swap it in so the config is never half-written
+            tmp_file = CONFIG_FILE + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, CONFIG_FILE)
         except Exception as e:
             print(f"Error saving config: {e}")
 
+    @contextmanager
+    def batch(self):
+        """Group several setters into a single write to disk"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._dirty = False
+                self.save_config()
+
     def add_printer(self, ip_address):
         """Add printer to recent list and set as last used"""
         if ip_address:
@@ -220,11 +326,12 @@ class Config:
     def set_video_enabled(self, value):
         """Set whether video is enabled"""
         self.config["video_enabled"] = value
+        self.video_enabled = value
         self.save_config()
 
     def get_video_enabled(self):
         """Get whether video is enabled"""
-        return self.config.get("video_enabled", True)
+        return self.video_enabled
 
     def set_auto_connect(self, value):
         """Set whether to auto-connect on startup"""
@@ -480,20 +587,21 @@ https://github.com/OverjoyedFrankenstein/Streamy<br>
         except ValueError:
             port = 554
 
-        # Save all settings
-        self.config.set_rtsp_port(port)
-        self.config.set_rtsp_path(self.path_input.text() or "/video")
-        self.config.set_transport(self.transport_combo.currentText().lower())
-        self.config.set_printer_display_name(self.display_name_input.text())
-        self.config.set_screenshot_path(self.screenshot_path_input.text())
-        self.config.set_include_timestamp(self.timestamp_checkbox.isChecked())
-        self.config.set_show_big_progress(self.show_big_progress_checkbox.isChecked())
-        self.config.set_show_fps(self.show_fps_checkbox.isChecked())
-        self.config.set_auto_connect(self.auto_connect_checkbox.isChecked())
-
-        # Update last used printer if IP changed
-        if self.ip_input.text().strip():
-            self.config.add_printer(self.ip_input.text().strip())
+        # Save all settings with a single write
+        with self.config.batch():
+            self.config.set_rtsp_port(port)
+            self.config.set_rtsp_path(self.path_input.text() or "/video")
+            self.config.set_transport(self.transport_combo.currentText().lower())
+            self.config.set_printer_display_name(self.display_name_input.text())
+            self.config.set_screenshot_path(self.screenshot_path_input.text())
+            self.config.set_include_timestamp(self.timestamp_checkbox.isChecked())
+            self.config.set_show_big_progress(self.show_big_progress_checkbox.isChecked())
+            self.config.set_show_fps(self.show_fps_checkbox.isChecked())
+            self.config.set_auto_connect(self.auto_connect_checkbox.isChecked())
+
+            # Update last used printer if IP changed
+            if self.ip_input.text().strip():
+                self.config.add_printer(self.ip_input.text().strip())
 
         self.accept()
 
@@ -502,6 +610,24 @@ class StreamyApp(QMainWindow):
     """Main application integrating video stream and printer monitor"""
     # Signal for updating UI from background thread
     printer_status_updated = pyqtSignal(object)
+    # Signal for reporting a snapshot saved in the background (success, filepath)
+    snapshot_saved = pyqtSignal(bool, object)
+    # Signal for reporting the result of a background video connect (success, ip_address)
+    video_connected = pyqtSignal(bool, str, int)
+
+    # Placeholder texts for the printer status labels
+    PROGRESS_EMPTY = "Progress: --"
+    BIG_PROGRESS_EMPTY = "--%"
+    CURRENT_LAYER_EMPTY = "Current Layer: --"
+    REMAIN_LAYERS_EMPTY = "Remaining Layers: --"
+    TOTAL_TIME_EMPTY = "Total Print Time: --"
+    REMAIN_TIME_EMPTY = "Remaining Time: --"
+    LAST_UPDATED_EMPTY = "Last Updated: --"
+
+    # Prefixes joined onto string values that change on most updates
+    LAST_UPDATED_PREFIX = "Last Updated: "
+    TOTAL_TIME_PREFIX = "Total Print Time: "
+    REMAIN_TIME_PREFIX = "Remaining Time: "
 
     def __init__(self, ip_address=None, auto_connect_delay=1000):
         """Initialize the application"""
@@ -526,20 +652,63 @@ class StreamyApp(QMainWindow):
         self.previous_status = "Not connected"
         # Store current connected IP address
         self.current_ip = None
+        # Set while a stream connect runs in the background; disconnecting bumps the
+        # generation so that connect's completion is discarded
+        self.connecting = False
+        self.connect_generation = 0
+
+        # Last text set on each status label (see set_label_text)
+        self.label_text_cache = {}
+
+        # Print fields shown by the last status update (see update_printer_status_ui)
+        self.last_print_state = None
+
+        # FPS calculation variables (snapshot of the streamer's frame counter)
+        self.fps_last_count = 0
+        self.fps_last_ns = time.monotonic_ns()
 
-        # FPS calculation variables
-        self.frame_count = 0
-        self.fps = 0
-        self.fps_start_time = time.time()
+        # Reusable RGB conversion buffer and the QImage that wraps it (see display_image)
+        self.rgb_buffer = None
+        self.rgb_image = None
+
+        # While the window is being resized, frames are scaled with cheap nearest-neighbor
+        # interpolation; once resizing settles the last image is redrawn at full quality
+        self.last_displayed = None
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(150)
+        self.resize_timer.timeout.connect(self.redisplay_last_image)
 
         # Create video streamer
         self.video_streamer = VideoStreamer()
+        # Frames only need converting to RGB if Qt can't display BGR as is
+        self.video_streamer.rgb_frames = QIMAGE_FORMAT_BGR888 is None
 
         # Create printer monitor
         self.printer_monitor = PrinterMonitor()
+        # Status pushed by the printer arrives on the websocket thread; the signal
+        # delivers it to the UI thread
+        self.printer_monitor.status_callback = self.printer_status_updated.emit
 
         # Connect signal for printer status updates
         self.printer_status_updated.connect(self.update_printer_status_ui)
+        self.snapshot_saved.connect(self.on_snapshot_saved)
+        self.video_connected.connect(self.on_video_connected)
+
+        # Shared background workers for snapshot writes and printer status requests,
+        # created once so threads stay warm; at most one status request runs at a time
+        self.io_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="streamy-io")
+        self.status_future = None
+        self.last_status_fetch = 0.0
+
+        # Persistent asyncio loop for printer monitor coroutines
+        self.async_loop = asyncio.new_event_loop()
+        threading.Thread(target=self.async_loop.run_forever,
+                         name="streamy-asyncio", daemon=True).start()
+
+        # Pause video updates while the application is suspended
+        QApplication.instance().applicationStateChanged.connect(
+            self.on_application_state_changed)
 
         # Setup UI
         self.setup_ui()
@@ -547,7 +716,7 @@ class StreamyApp(QMainWindow):
         # Set up timer for updating video (30fps)
         self.video_timer = QTimer()
         self.video_timer.timeout.connect(self.update_frame)
-        self.video_timer.setInterval(33)  # ~30 FPS
+        self.video_timer.setInterval(FRAME_INTERVAL_MS)  # ~30 FPS
 
         # Set up timer for status message reset
         self.status_timer = QTimer(self)
@@ -557,8 +726,9 @@ class StreamyApp(QMainWindow):
         # Set up timer for printer status updates
         self.printer_status_timer = QTimer(self)
         self.printer_status_timer.timeout.connect(self.fetch_printer_status)
-        # Update every 1 second
-        self.printer_status_timer.setInterval(1000)
+        # The printer pushes status changes over the websocket as they happen; this
+        # only periodically requests a full refresh
+        self.printer_status_timer.setInterval(STATUS_REFRESH_MS)
 
         # Set up timer for FPS calculation (update every second)
         self.fps_timer = QTimer(self)
@@ -584,8 +754,20 @@ class StreamyApp(QMainWindow):
             # Just set the IP but don't connect
             self.ip_combo.setCurrentText(self.config.get_last_used_printer())
 
+    def compute_sizes(self):
+        """Compute font-dependent widget widths once, before building the UI"""
+        metrics = QFontMetrics(self.font())
+        # Right-hand column fits the longest status text (Qt sizes are already
+        # in device-independent pixels, so this holds on HiDPI screens too)
+        self.right_column_width = max(
+            213, metrics.horizontalAdvance("Last Updated: 0000-00-00 00:00:00"))
+        # Widest possible FPS text (88.8 FPS)
+        self.fps_label_width = metrics.horizontalAdvance("88.8 FPS")
+
     def setup_ui(self):
         """Set up the user interface"""
+        self.compute_sizes()
+
         # Main widget and layout
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
@@ -652,7 +834,7 @@ class StreamyApp(QMainWindow):
         controls_layout.addWidget(right_section, 1)
 
         # Video display
-        self.video_frame = QLabel()
+        self.video_frame = VideoLabel()
         self.video_frame.setFrameStyle(QFrame.StyledPanel)
         self.video_frame.setAlignment(Qt.AlignCenter)
         self.video_frame.setMinimumSize(640, 480)
@@ -710,21 +892,21 @@ class StreamyApp(QMainWindow):
         # Status and last updated labels - same width as snapshot button for alignment
         self.print_status_label = QLabel("Status: Not Connected")
         self.print_status_label.setAlignment(Qt.AlignLeft)
-        self.print_status_label.setFixedWidth(213)  # Match snapshot button width
+        self.print_status_label.setFixedWidth(self.right_column_width)
         self.last_updated_label = QLabel("Last Updated: --")
         self.last_updated_label.setAlignment(Qt.AlignLeft)
-        self.last_updated_label.setFixedWidth(213)  # Match snapshot button width
+        self.last_updated_label.setFixedWidth(self.right_column_width)
 
         # Create snapshot button
         self.snapshot_btn = QPushButton("Snapshot")
         self.snapshot_btn.clicked.connect(self.take_snapshot)
-        self.snapshot_btn.setFixedWidth(213)  # Adjust this value as needed
+        self.snapshot_btn.setFixedWidth(self.right_column_width)
         # Disabled initially until connected
         self.snapshot_btn.setEnabled(False)
 
         # Bottom info widget (Settings and FPS) - same width as snapshot button for alignment
         bottom_info_widget = QWidget()
-        bottom_info_widget.setFixedWidth(213)  # Match snapshot button width
+        bottom_info_widget.setFixedWidth(self.right_column_width)
         bottom_info_layout = QHBoxLayout(bottom_info_widget)
         bottom_info_layout.setContentsMargins(0, 0, 0, 0)
         bottom_info_layout.setAlignment(Qt.AlignVCenter)
@@ -738,9 +920,7 @@ class StreamyApp(QMainWindow):
         self.fps_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         self.fps_label.setStyleSheet("color: gray;")
         self.fps_label.setVisible(self.config.get_show_fps())
-        # Set fixed width based on widest possible FPS (88.8 FPS)
-        fps_metrics = QFontMetrics(self.fps_label.font())
-        self.fps_label.setFixedWidth(fps_metrics.horizontalAdvance("88.8 FPS"))
+        self.fps_label.setFixedWidth(self.fps_label_width)
 
         # Add widgets to bottom info layout
         bottom_info_layout.addWidget(self.fps_label)
@@ -776,15 +956,18 @@ class StreamyApp(QMainWindow):
             logger.warning("Cannot auto-connect: No IP address available")
 
     def calculate_fps(self):
-        """Calculate frames per second"""
-        if self.frame_count > 0:
-            elapsed_time = time.time() - self.fps_start_time
-            self.fps = self.frame_count / elapsed_time
-            self.fps_label.setText(f"{self.fps:.1f} FPS")
+        """Calculate displayed frames per second from the streamer's delivered-frame counter"""
+        count = self.video_streamer.frames_delivered
+        now_ns = time.monotonic_ns()
+        frames = count - self.fps_last_count
+        elapsed_ns = now_ns - self.fps_last_ns
 
-            # Reset counters
-            self.frame_count = 0
-            self.fps_start_time = time.time()
+        if frames > 0 and elapsed_ns > 0:
+            text = f"{frames * 1e9 / elapsed_ns:.1f} FPS"
+            self.set_label_text(self.fps_label, text)
+
+        self.fps_last_count = count
+        self.fps_last_ns = now_ns
 
     def toggle_video(self):
         """Toggle video streaming on/off"""
@@ -792,7 +975,7 @@ class StreamyApp(QMainWindow):
 
         if is_enabled:
             # Disable video
-            self.video_toggle_btn.setText("Enable Video")
+            self.set_label_text(self.video_toggle_btn, "Enable Video")
             self.config.set_video_enabled(False)
 
             # Show paused message
@@ -803,7 +986,7 @@ class StreamyApp(QMainWindow):
                 self.snapshot_btn.setEnabled(False)
         else:
             # Enable video
-            self.video_toggle_btn.setText("Disable Video")
+            self.set_label_text(self.video_toggle_btn, "Disable Video")
             self.config.set_video_enabled(True)
 
             # Resume video if connected
@@ -812,18 +995,30 @@ class StreamyApp(QMainWindow):
 
     def clear_printer_status_ui(self):
         """Reset printer status UI elements to default values"""
-        self.progress_label.setText("Progress: --")
-        self.big_progress_label.setText("--%")
-        self.remain_layers_label.setText("Remaining Layers: --")
-        self.current_layer_label.setText("Current Layer: --")
-        self.total_time_label.setText("Total Print Time: --")
-        self.remain_time_label.setText("Remaining Time: --")
-        self.print_status_label.setText("Status: Not Connected")
-        self.last_updated_label.setText("Last Updated: --")
+        self.last_print_state = None
+        self.set_label_text(self.progress_label, self.PROGRESS_EMPTY)
+        self.set_label_text(self.big_progress_label, self.BIG_PROGRESS_EMPTY)
+        self.set_label_text(self.remain_layers_label, self.REMAIN_LAYERS_EMPTY)
+        self.set_label_text(self.current_layer_label, self.CURRENT_LAYER_EMPTY)
+        self.set_label_text(self.total_time_label, self.TOTAL_TIME_EMPTY)
+        self.set_label_text(self.remain_time_label, self.REMAIN_TIME_EMPTY)
+        self.set_label_text(self.print_status_label, "Status: Not Connected")
+        self.set_label_text(self.last_updated_label, self.LAST_UPDATED_EMPTY)
+
+    def set_label_text(self, label, text):
+        """Set a label's text only if it changed, avoiding needless relayout and repaint
+
+        Labels updated through this must not have setText called on them directly,
+        or the cached text goes stale.
+        """
+        if self.label_text_cache.get(label) != text:
+            label.setText(text)
+            self.label_text_cache[label] = text
 
     def update_printer_status_ui(self, printer_data):
         """Update UI with printer status information"""
-        if not printer_data:
+        # Ignore pushes that arrive after the printer was disconnected
+        if not printer_data or not self.printer_monitor.is_connected:
             return
 
         # Extract print information
@@ -831,24 +1026,25 @@ class StreamyApp(QMainWindow):
         print_info = status.print_info
 
         # Update timestamp
-        self.last_updated_label.setText(
-            f"Last Updated: {printer_data.last_updated}")
-
-        # Determine status text based on status_code
-        status_code = print_info.status_code
-        if status_code in [0, 8]:
-            status_text = "Idle"
-        elif status_code == 1:
-            status_text = "Preparing to print"
-        elif status_code in [2, 3, 4]:
-            status_text = "Printing"
-        elif status_code == 7:
-            status_text = "Finishing"
-        else:
-            status_text = "Unknown"
+        self.set_label_text(
+            self.last_updated_label, self.LAST_UPDATED_PREFIX + printer_data.last_updated)
+
+        # Nothing else to redo if none of the displayed print fields changed
+        print_state = (print_info.status_code, print_info.is_printing,
+                       print_info.current_layer, print_info.total_layer,
+                       print_info.total_time, print_info.remain_time)
+        if print_state == self.last_print_state:
+            return
+        self.last_print_state = print_state
 
-        # Update print status label
-        self.print_status_label.setText(f"Status: {status_text}")
+        # Refresh less often while nothing is printing
+        interval = STATUS_REFRESH_MS if print_info.is_printing else STATUS_REFRESH_IDLE_MS
+        if self.printer_status_timer.interval() != interval:
+            self.printer_status_timer.setInterval(interval)
+
+        # Update print status label based on status_code
+        self.set_label_text(self.print_status_label,
+                            STATUS_TEXTS.get(print_info.status_code, "Status: Unknown"))
 
         # Check if there's an active print
         if print_info.is_printing:
@@ -858,8 +1054,8 @@ class StreamyApp(QMainWindow):
             else:
                 progress = 0.0
             progress = max(0, min(100, progress))
-            self.progress_label.setText(f"Progress: {progress:.1f}%")
-            self.big_progress_label.setText(f"{progress:.1f}%")
+            self.set_label_text(self.progress_label, f"Progress: {progress:.1f}%")
+            self.set_label_text(self.big_progress_label, f"{progress:.1f}%")
 
             # Update layer information
             if print_info.total_layer > 0:
@@ -867,46 +1063,53 @@ class StreamyApp(QMainWindow):
                 total_layer = print_info.total_layer
                 remaining_layers = max(0, total_layer - current_layer)
 
-                self.current_layer_label.setText(
-                    f"Current Layer: {current_layer}/{total_layer}")
-                self.remain_layers_label.setText(
-                    f"Remaining Layers: {remaining_layers}")
+                self.set_label_text(
+                    self.current_layer_label, f"Current Layer: {current_layer}/{total_layer}")
+                self.set_label_text(
+                    self.remain_layers_label, f"Remaining Layers: {remaining_layers}")
             else:
-                self.current_layer_label.setText("Current Layer: --")
-                self.remain_layers_label.setText("Remaining Layers: --")
+                self.set_label_text(self.current_layer_label, self.CURRENT_LAYER_EMPTY)
+                self.set_label_text(self.remain_layers_label, self.REMAIN_LAYERS_EMPTY)
 
             # Update time information
             # Try to calculate times if not provided directly
             total_time_secs = print_info.total_time
             remain_time_secs = print_info.remain_time
 
-            # If we have total_time but no remain_time, calculate it from progress
-            if total_time_secs > 0 and remain_time_secs == 0 and progress > 0:
-                remain_time_secs = int(total_time_secs * (100 - progress) / 100)
+            # Layers done and left, for deriving a missing time with integer math
+            total_layer = print_info.total_layer
+            done_layers = max(0, min(total_layer, print_info.current_layer))
+            left_layers = total_layer - done_layers
+
+            # If we have total_time but no remain_time, scale it by the layers left
+            if total_time_secs > 0 and remain_time_secs == 0 and done_layers > 0:
+                remain_time_secs = total_time_secs * left_layers // total_layer
 
-            # If we have remain_time but no total_time, calculate it from progress
-            if remain_time_secs > 0 and total_time_secs == 0 and progress > 0:
-                total_time_secs = int(remain_time_secs * 100 / (100 - progress))
+            # If we have remain_time but no total_time, scale it up by the layers left
+            if remain_time_secs > 0 and total_time_secs == 0 and 0 < done_layers < total_layer:
+                total_time_secs = remain_time_secs * total_layer // left_layers
 
             if total_time_secs > 0:
                 total_time = self.printer_monitor.format_time(total_time_secs)
-                self.total_time_label.setText(f"Total Print Time: {total_time}")
+                self.set_label_text(
+                    self.total_time_label, self.TOTAL_TIME_PREFIX + total_time)
             else:
-                self.total_time_label.setText("Total Print Time: --")
+                self.set_label_text(self.total_time_label, self.TOTAL_TIME_EMPTY)
 
             if remain_time_secs > 0:
                 remain_time = self.printer_monitor.format_time(remain_time_secs)
-                self.remain_time_label.setText(f"Remaining Time: {remain_time}")
+                self.set_label_text(
+                    self.remain_time_label, self.REMAIN_TIME_PREFIX + remain_time)
             else:
-                self.remain_time_label.setText("Remaining Time: --")
+                self.set_label_text(self.remain_time_label, self.REMAIN_TIME_EMPTY)
         else:
             # No active print, clear progress fields
-            self.progress_label.setText("Progress: --")
-            self.big_progress_label.setText("--%")
-            self.current_layer_label.setText("Current Layer: --")
-            self.remain_layers_label.setText("Remaining Layers: --")
-            self.total_time_label.setText("Total Print Time: --")
-            self.remain_time_label.setText("Remaining Time: --")
+            self.set_label_text(self.progress_label, self.PROGRESS_EMPTY)
+            self.set_label_text(self.big_progress_label, self.BIG_PROGRESS_EMPTY)
+            self.set_label_text(self.current_layer_label, self.CURRENT_LAYER_EMPTY)
+            self.set_label_text(self.remain_layers_label, self.REMAIN_LAYERS_EMPTY)
+            self.set_label_text(self.total_time_label, self.TOTAL_TIME_EMPTY)
+            self.set_label_text(self.remain_time_label, self.REMAIN_TIME_EMPTY)
 
     def fetch_printer_status(self):
         """Fetch printer status in a background thread to avoid UI freezing"""
@@ -921,9 +1124,16 @@ class StreamyApp(QMainWindow):
             except Exception as e:
                 logger.error(f"Error fetching printer status: {e}")
 
-        # Run in a separate thread to avoid blocking UI
-        executor = ThreadPoolExecutor(max_workers=1)
-        executor.submit(get_status_thread)
+        # Drop the request if the previous one is still running or was sent just now
+        if self.status_future and not self.status_future.done():
+            return
+        now = time.monotonic()
+        if now - self.last_status_fetch < STATUS_FETCH_MIN_INTERVAL:
+            return
+        self.last_status_fetch = now
+
+        # Run on a background worker to avoid blocking UI
+        self.status_future = self.io_executor.submit(get_status_thread)
 
     async def connect_to_printer_monitor(self, ip_address):
         """Connect to the Elegoo printer for status monitoring"""
@@ -936,29 +1146,18 @@ class StreamyApp(QMainWindow):
         # Connect to the printer
         return await self.printer_monitor.connect()
 
-    def transport_changed(self, text):
-        """Handle transport protocol change"""
-        self.config.set_transport(text.lower())
-
-    def path_changed(self):
-        """Handle RTSP path change"""
-        path = self.path_input.text().strip()
-        if not path:
-            path = "/video"
-            self.path_input.setText(path)
-        self.config.set_rtsp_path(path)
-
-    def port_changed(self):
-        """Handle RTSP port change"""
-        port_text = self.port_input.text().strip()
+    def on_printer_monitor_connected(self, future):
+        """Note the monitor's initial status request once it has connected"""
         try:
-            port = int(port_text) if port_text else 554
-            if port < 1 or port > 65535:
-                port = 554
-        except ValueError:
-            port = 554
-        self.port_input.setText(str(port))
-        self.config.set_rtsp_port(port)
+            connected = future.result()
+        except Exception as e:
+            logger.error(f"Error connecting to printer monitor: {e}")
+            return
+
+        if connected:
+            # PrinterMonitor.connect() already requested the status (the reply
+            # arrives through status_callback), so count it for the throttle
+            self.last_status_fetch = time.monotonic()
 
     def open_settings(self):
         """Open the settings dialog"""
@@ -974,15 +1173,15 @@ class StreamyApp(QMainWindow):
 
         if printer_name:
             # Show custom printer name - bold and larger font
-            self.ip_label.setText(printer_name)
+            self.set_label_text(self.ip_label, printer_name)
             self.ip_label.setStyleSheet("font-weight: bold; font-size: 14pt;")
         elif last_printer:
             # No custom name - show IP address instead
-            self.ip_label.setText(last_printer)
+            self.set_label_text(self.ip_label, last_printer)
             self.ip_label.setStyleSheet("font-weight: bold; font-size: 14pt;")
         else:
             # No printer at all - show placeholder
-            self.ip_label.setText("No Printer")
+            self.set_label_text(self.ip_label, "No Printer")
             self.ip_label.setStyleSheet("font-weight: bold; font-size: 14pt; color: gray;")
 
         # Always show label and hide combo
@@ -1020,7 +1219,7 @@ class StreamyApp(QMainWindow):
         """Reset status message to previous state after temporary message"""
         # Only reset if not already reset and previous status exists
         if self.previous_status:
-            self.status_label.setText(self.previous_status)
+            self.set_label_text(self.status_label, self.previous_status)
             self.previous_status = None  # Clear to avoid repeated resets
 
     def show_temporary_status(self, message, duration_ms=5000):
@@ -1029,7 +1228,7 @@ class StreamyApp(QMainWindow):
         self.previous_status = self.status_label.text()
 
         # Update status label with new message
-        self.status_label.setText(message)
+        self.set_label_text(self.status_label, message)
 
         # Stop any existing timer
         if self.status_timer.isActive():
@@ -1051,10 +1250,15 @@ class StreamyApp(QMainWindow):
                 self, "Error", "Please enter a printer IP address")
             return
 
-        # Update status to connecting (yellow)
+        # Only one connect at a time (the IP field's Enter key bypasses the button)
+        if self.connecting:
+            return
+
+        # Update status to connecting (yellow); it is painted while the stream
+        # connects in the background
         self.status_indicator.setColor(StatusIndicator.YELLOW)
-        self.status_label.setText(f"Connecting...")
-        QApplication.processEvents()
+        self.set_label_text(self.status_label, f"Connecting...")
+        self.connect_btn.setEnabled(False)
 
         # Disconnect if already connected
         if self.video_streamer.is_running:
@@ -1066,13 +1270,41 @@ class StreamyApp(QMainWindow):
         self.video_streamer.set_path(self.config.get_rtsp_path())
         self.video_streamer.set_transport(self.config.get_transport())
 
-        # Try to connect to the camera
-        if self.video_streamer.connect():
+        # Try to connect to the camera without blocking the UI
+        self.connecting = True
+        self.connect_generation += 1
+        self.io_executor.submit(self.connect_video_stream, ip_address,
+                                self.connect_generation)
+
+    def connect_video_stream(self, ip_address, generation):
+        """Open the video stream (runs on a background worker)"""
+        try:
+            success = self.video_streamer.connect()
+        except Exception as e:
+            logger.error(f"Error connecting to video stream: {e}")
+            success = False
+        if success and generation != self.connect_generation:
+            # Cancelled meanwhile; close the stream here too in case the window
+            # is gone and the signal is never delivered
+            self.video_streamer.disconnect()
+        self.video_connected.emit(success, ip_address, generation)
+
+    def on_video_connected(self, success, ip_address, generation):
+        """Finish connecting once the video stream has been opened"""
+        self.connecting = False
+        self.connect_btn.setEnabled(True)
+
+        if generation != self.connect_generation:
+            # Disconnected (or closed) while connecting
+            self.video_streamer.disconnect()
+            return
+
+        if success:
             # Successfully connected to video stream
             self.status_indicator.setColor(StatusIndicator.GREEN)
             # Store current IP and show in status
             self.current_ip = ip_address
-            self.status_label.setText(f"Connected: {ip_address}")
+            self.set_label_text(self.status_label, f"Connected: {ip_address}")
 
             # Save to config
             self.config.add_printer(ip_address)
@@ -1084,39 +1316,30 @@ class StreamyApp(QMainWindow):
 
             # Set video toggle button text based on current state
             if self.config.get_video_enabled():
-                self.video_toggle_btn.setText("Disable Video")
+                self.set_label_text(self.video_toggle_btn, "Disable Video")
             else:
-                self.video_toggle_btn.setText("Enable Video")
+                self.set_label_text(self.video_toggle_btn, "Enable Video")
 
             # Start video timer
             self.video_timer.start()
 
             # Start FPS timer
+            self.fps_last_count = self.video_streamer.frames_delivered
+            self.fps_last_ns = time.monotonic_ns()
             self.fps_timer.start()
 
             # Start the status update timer (must be on main thread)
-            self.printer_status_timer.start()
-
-            # Connect to Elegoo printer monitor asynchronously
-            def connect_printer_monitor_async():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                connected = loop.run_until_complete(
-                    self.connect_to_printer_monitor(ip_address))
-                loop.close()
-
-                if connected:
-                    # Get initial status
-                    self.fetch_printer_status()
+            self.printer_status_timer.start(STATUS_REFRESH_MS)
 
-            # Start the printer monitor connection in a separate thread
-            threading.Thread(
-                target=connect_printer_monitor_async, daemon=True).start()
+            # Connect to Elegoo printer monitor asynchronously on the background loop
+            future = asyncio.run_coroutine_threadsafe(
+                self.connect_to_printer_monitor(ip_address), self.async_loop)
+            future.add_done_callback(self.on_printer_monitor_connected)
 
         else:
             # Failed to connect to camera
             self.status_indicator.setColor(StatusIndicator.RED)
-            self.status_label.setText("Not connected")
+            self.set_label_text(self.status_label, "Not connected")
             rtsp_url = f"rtsp://{ip_address}:{self.config.get_rtsp_port()}{self.config.get_rtsp_path()}"
             QMessageBox.critical(self, "Connection Error",
                                  f"Could not connect to the camera at {rtsp_url}.\n\n"
@@ -1128,6 +1351,13 @@ class StreamyApp(QMainWindow):
         # Clear current IP
         self.current_ip = None
 
+        # Cancel a connect still running in the background; the button stays
+        # disabled until it has finished
+        if self.connecting:
+            self.connect_generation += 1
+            self.status_indicator.setColor(StatusIndicator.GRAY)
+            self.set_label_text(self.status_label, "Not connected")
+
         # Disconnect from video stream
         if self.video_streamer.is_running:
             # Stop timers
@@ -1139,14 +1369,14 @@ class StreamyApp(QMainWindow):
 
             # Update status
             self.status_indicator.setColor(StatusIndicator.GRAY)
-            self.status_label.setText("Not connected")
+            self.set_label_text(self.status_label, "Not connected")
 
             # Disable buttons
             self.snapshot_btn.setEnabled(False)
             self.video_toggle_btn.setEnabled(False)
 
             # Reset FPS counter
-            self.fps_label.setText("00.0 FPS")
+            self.set_label_text(self.fps_label, "00.0 FPS")
 
             # Show no connection message
             self.show_no_connection_message()
@@ -1169,12 +1399,31 @@ class StreamyApp(QMainWindow):
                                 "No video stream is active")
             return
 
-        # Take snapshot with timestamp if enabled in settings
-        success, filepath = self.video_streamer.take_snapshot(
+        # Take snapshot with timestamp if enabled in settings; encoding and writing
+        # the image happens in the background so the UI stays responsive
+        future = self.io_executor.submit(
+            self.video_streamer.take_snapshot,
             add_timestamp=self.config.get_include_timestamp(),
             save_path=self.config.get_screenshot_path()
         )
+        future.add_done_callback(self.on_snapshot_done)
+
+    def on_snapshot_done(self, future):
+        """Hand the background snapshot's result to the GUI thread"""
+        if future.cancelled():
+            # Dropped at shutdown, nothing to report
+            return
+
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Error taking snapshot: {error}")
+            self.snapshot_saved.emit(False, None)
+            return
+
+        self.snapshot_saved.emit(*future.result())
 
+    def on_snapshot_saved(self, success, filepath):
+        """Report the result of a background snapshot"""
         if success:
             # Show temporary success message
             self.show_temporary_status("Snapshot!", 5000)
@@ -1188,66 +1437,156 @@ class StreamyApp(QMainWindow):
         if not self.video_streamer.is_running:
             return
 
-        # Check if video is enabled in settings
-        if not self.config.get_video_enabled():
+        # Only take frames when video is enabled in settings and actually visible
+        # (a minimized window still counts as visible to Qt); otherwise the capture
+        # thread just keeps grabbing without decoding
+        if (not self.config.video_enabled or self.isMinimized()
+                or not self.video_frame.isVisible()):
             return
 
-        # Get a new frame with timestamp
-        success, frame = self.video_streamer.get_frame(add_timestamp=True)
+        # Have the capture thread scale frames to the current label size, with the
+        # cheap filter while a window resize is in progress
+        rect = self.video_frame.contentsRect()
+        self.video_streamer.display_size = (rect.width(), rect.height())
+        self.video_streamer.display_interpolation = (
+            cv2.INTER_NEAREST if self.resize_timer.isActive() else None)
+
+        # Take the newest frame from the capture thread
+        success, frame = self.video_streamer.get_latest()
+
+        if success and frame is None:
+            # No new frame since the last tick
+            return
 
         if success:
             # Frame received successfully - ensure status is green
             if self.status_indicator.color != StatusIndicator.GREEN:
                 self.status_indicator.setColor(StatusIndicator.GREEN)
                 if self.current_ip:
-                    self.status_label.setText(f"Connected: {self.current_ip}")
+                    self.set_label_text(self.status_label, f"Connected: {self.current_ip}")
                 else:
-                    self.status_label.setText("Connected")
+                    self.set_label_text(self.status_label, "Connected")
 
             # Display the frame
-            self.display_image(frame)
-
-            # Update frame count for FPS calculation
-            self.frame_count += 1
+            self.display_image(frame, bgr=not self.video_streamer.rgb_frames)
         else:
             # Failed to get frame - update status and disconnect
             self.status_indicator.setColor(StatusIndicator.YELLOW)
-            self.status_label.setText("Connected but not able to stream")
+            self.set_label_text(self.status_label, "Connected but not able to stream")
             self.disconnect_printer()
 
-    def display_image(self, img):
-        """Convert OpenCV image to Qt format and display it"""
+    def display_image(self, img, bgr=True):
+        """Convert OpenCV image to Qt format and display it
+
+        Args:
+            img (numpy.ndarray): Image to display
+            bgr (bool): Whether a color image is BGR (OpenCV's order) rather than RGB
+        """
         if img is None:
             return
 
-        # Convert the image to RGB format (OpenCV uses BGR)
-        if len(img.shape) == 3:  # Color image
-            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            format = QImage.Format_RGB888
-        else:  # Grayscale image
-            format = QImage.Format_Grayscale8
+        self.last_displayed = (img, bgr)
 
-        # Create QImage from the numpy array
+        # Scale to fit the label while maintaining aspect ratio (a no-op for stream
+        # frames the capture thread already fitted). OpenCV's resize is much cheaper
+        # than smooth-scaling a QPixmap, and it shrinks the frame before the color
+        # conversion and upload.
+        rect = self.video_frame.contentsRect()
+        interpolation = cv2.INTER_NEAREST if self.resize_timer.isActive() else None
+        img = resize_to_fit(img, rect.width(), rect.height(), interpolation)
         h, w = img.shape[:2]
-        bytes_per_line = 3 * w if len(img.shape) == 3 else w
-        q_img = QImage(img.data, w, h, bytes_per_line, format)
 
-        # Get the size of the label
-        label_size = self.video_frame.size()
+        if len(img.shape) == 3 and not bgr:  # Color image, already RGB
+            buffer = np.ascontiguousarray(img)
+            q_img = QImage(buffer.data, w, h, 3 * w, QImage.Format_RGB888)
+        elif len(img.shape) == 3 and QIMAGE_FORMAT_BGR888 is not None:  # Color image, BGR as is
+            buffer = np.ascontiguousarray(img)
+            q_img = QImage(buffer.data, w, h, 3 * w, QIMAGE_FORMAT_BGR888)
+        elif len(img.shape) == 3:  # Color image, older Qt without BGR888
+            # Reuse one RGB buffer (and the QImage wrapping it) while the frame size is unchanged
+            if self.rgb_buffer is None or self.rgb_buffer.shape != img.shape:
+                self.rgb_buffer = np.empty(img.shape, dtype=np.uint8)
+                self.rgb_image = QImage(self.rgb_buffer.data, w, h, 3 * w, QImage.Format_RGB888)
+
+            # Convert the image to RGB format in place (OpenCV uses BGR)
+            cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=self.rgb_buffer)
+            buffer = self.rgb_buffer
+            q_img = self.rgb_image
+        else:  # Grayscale image
+            buffer = np.ascontiguousarray(img)
+            q_img = QImage(buffer.data, w, h, w, QImage.Format_Grayscale8)
+
+        # Display the image (painted directly from the buffer, no pixmap copy)
+        self.video_frame.setFrameImage(q_img, buffer)
+
+    def redisplay_last_image(self):
+        """Redraw the last image at full quality once a resize has settled"""
+        # Live frames need no redraw: the capture thread fits the next one with the
+        # normal filter again, whereas rescaling an already fitted frame would blur it
+        if self.video_streamer.is_running and self.config.video_enabled:
+            return
+        if self.last_displayed is not None:
+            self.display_image(*self.last_displayed)
 
-        # Scale the image to fit the label while maintaining aspect ratio
-        pixmap = QPixmap.fromImage(q_img)
-        scaled_pixmap = pixmap.scaled(
-            label_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    def resizeEvent(self, event):
+        """Use fast scaling until the resize settles"""
+        self.resize_timer.start()
+        super().resizeEvent(event)
 
-        # Display the image
-        self.video_frame.setPixmap(scaled_pixmap)
+    def set_video_updates_paused(self, paused):
+        """Stop or restart the video and FPS timers while the window can't be seen
+
+        The capture thread keeps grabbing (without decoding) so the RTSP session
+        stays alive and the picture is current as soon as the window comes back.
+        """
+        if not self.video_streamer.is_running:
+            return
+
+        if paused:
+            self.video_timer.stop()
+            self.fps_timer.stop()
+        elif not self.video_timer.isActive():
+            self.fps_last_count = self.video_streamer.frames_delivered
+            self.fps_last_ns = time.monotonic_ns()
+            self.video_timer.start()
+            self.fps_timer.start()
+
+    def on_application_state_changed(self, state):
+        """Pause video updates when the application is suspended"""
+        if state == Qt.ApplicationSuspended:
+            self.set_video_updates_paused(True)
+        elif state == Qt.ApplicationActive and not self.isMinimized() and self.isVisible():
+            self.set_video_updates_paused(False)
+
+    def changeEvent(self, event):
+        """Pause video updates while the window is minimized"""
+        if event.type() == QEvent.WindowStateChange:
+            self.set_video_updates_paused(bool(self.windowState() & Qt.WindowMinimized))
+        super().changeEvent(event)
+
+    def hideEvent(self, event):
+        """Pause video updates while the window is hidden"""
+        self.set_video_updates_paused(True)
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        """Resume video updates when the window is shown again"""
+        if not self.isMinimized():
+            self.set_video_updates_paused(False)
+        super().showEvent(event)
 
     def closeEvent(self, event):
         """Handle window close event"""
         # Disconnect everything
         self.disconnect_printer()
 
+        # Stop the asyncio loop and background workers without waiting on queued work
+        self.async_loop.call_soon_threadsafe(self.async_loop.stop)
+        if sys.version_info >= (3, 9):
+            self.io_executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            self.io_executor.shutdown(wait=False)
+
         # Call parent's closeEvent
         super().closeEvent(event)
 
@@ -5,9 +5,11 @@ Built upon the functionality in goo.py.
 """
 
 import asyncio
+import itertools
 import json
 import logging
 import os
+import secrets
 import socket
 import sys
 import threading
@@ -15,6 +17,7 @@ import time
 import subprocess
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 # Configure logging for printmon
@@ -23,26 +26,48 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger("streamy.printmon")
+# Parse errors in the status dataclasses are reported on the standalone monitor's logger
+monitor_logger = logging.getLogger("elegoo_monitor")
 
 # Note: Package checking is handled by main.py for Streamy app
 
+# orjson is optional; fall back to the stdlib json module when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fastest available JSON decoder (accepts str or bytes)
+_json_loads = orjson.loads if orjson else json.loads
+# Matching encoder; websocket-client sends both str and bytes as text frames
+_json_dumps = orjson.dumps if orjson else json.dumps
+
 # Import websocket (required for PrinterMonitor)
 import websocket
 
-# Conditional imports for GUI (only needed when running stats.py directly)
-# These may fail in PyInstaller builds that exclude tkinter
-try:
-    import tkinter as tk
-    from tkinter import ttk, scrolledtext, messagebox
-    from PIL import Image, ImageTk, ImageDraw
-    _HAS_GUI = True
-except ImportError:
-    _HAS_GUI = False
-    tk = None
-    ttk = None
-    scrolledtext = None
-    messagebox = None
-    ImageTk = None
+# GUI modules (only needed when running stats.py directly) are imported by
+# _load_gui() so that main.py importing PrinterMonitor does not pull in tkinter/PIL.
+# They may be missing in PyInstaller builds that exclude tkinter
+tk = None
+ttk = None
+scrolledtext = None
+messagebox = None
+ImageTk = None
+
+
+def _load_gui() -> bool:
+    """Import the tkinter/PIL GUI modules; returns False if they are unavailable."""
+    global tk, ttk, scrolledtext, messagebox, ImageTk
+    if tk is not None:
+        return True
+    try:
+        import tkinter
+        from tkinter import ttk as _ttk, scrolledtext as _scrolledtext, messagebox as _messagebox
+        from PIL import ImageTk as _ImageTk
+    except ImportError:
+        return False
+    tk, ttk, scrolledtext, messagebox, ImageTk = tkinter, _ttk, _scrolledtext, _messagebox, _ImageTk
+    return True
 
 # Import all the classes and functions from goo.py that we need
 # We're copying the relevant classes directly to make the script self-contained
@@ -51,7 +76,140 @@ except ImportError:
 # Classes from goo.py - Copy of the data models and client implementation
 # -----------------------------------------------------------------------------
 
-@dataclass
+# Field name variations seen across printer firmwares, in order of preference
+_UV_TEMP_FIELDS = ("UVTemp", "UV", "uv_temp", "UVTemperature", "LightTemp", "UVPanelTemp", "UVPanel")
+_UV_PARENT_FIELDS = ("UV", "UVPanel", "Light")
+_UV_CHILD_FIELDS = ("Temp", "Temperature", "Value", "Current")
+_IS_PRINTING_FIELDS = ("IsPrinting", "Printing", "isPrinting", "is_printing", "Status")
+_PROGRESS_FIELDS = ("Progress", "progress", "PrintProgress", "print_progress", "Percent")
+_CURRENT_LAYER_FIELDS = ("CurrentLayer", "Layer", "current_layer", "CurrentLine", "LineNum", "Layers")
+_TOTAL_LAYER_FIELDS = ("TotalLayer", "TotalLayers", "MaxLayer", "Lines", "total_layers", "Slices")
+_REMAIN_TIME_FIELDS = ("RemainTime", "TimeLeft", "remain_time", "RemainingTime", "TimeRemaining",
+                       "PrintTimeLeft", "LeftTime", "remainTime", "leftTime")
+_TOTAL_TIME_FIELDS = ("TotalTime", "total_time", "TotalPrintTime", "PrintTime", "PrintDuration",
+                      "EstimatedTime", "totalTime", "printTime")
+_TASK_ID_FIELDS = ("TaskID", "task_id", "JobID", "PrintID")
+_TASK_NAME_FIELDS = ("TaskName", "task_name", "FileName", "JobName", "PrintName")
+
+# Elegoo status codes: 0,8=idle, 1=preparing, 2-4=printing, 7=finishing
+_ACTIVE_STATUS_CODES = frozenset((1, 2, 3, 4, 7))
+_ACTIVE_STATUS_TEXTS = frozenset(("running", "printing", "busy"))
+
+# Marker for a missing dict key (None can be a real value)
+_MISSING = object()
+
+# Status dataclasses are created for every printer message; drop the per-instance
+# __dict__ where dataclass supports it (Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Extra SDCP commands sent after the status request (0) for more complete data:
+# detailed printer status, print info and temperature
+_EXTRA_STATUS_CMDS = (100, 200, 300)
+
+# Topics whose handlers only log at DEBUG level (command acks, notices, errors)
+_LOG_ONLY_TOPIC_MARKERS = ('"sdcp/response/', '"sdcp/notice/', '"sdcp/error/')
+
+# Window for the printer to answer a UDP discovery probe, in seconds
+DISCOVERY_TIMEOUT = 1
+
+# Longest wait for the printer to answer a status request
+STATUS_REPLY_TIMEOUT = 0.5
+
+# The client is polled on the Tk main thread, so keep its wait short enough
+# not to stall the GUI
+CLIENT_STATUS_REPLY_TIMEOUT = 0.2
+
+# Shared (never mutated) empty payload for commands without arguments
+_EMPTY_CMD_DATA: Dict[str, Any] = {}
+
+
+def _new_cmd_template(printer) -> Dict[str, Any]:
+    """Build the SDCP request envelope template for a printer. It is never
+    mutated: each send shallow-copies it and fills in Cmd, Data, RequestID
+    and TimeStamp."""
+    return {
+        "Id": printer.connection,
+        "Data": {
+            "Cmd": 0,
+            "Data": _EMPTY_CMD_DATA,
+            "RequestID": "",
+            "MainboardID": printer.id,
+            "TimeStamp": 0,
+            "From": 0,
+        },
+        "Topic": f"sdcp/request/{printer.id}",
+    }
+
+
+# Zero-padded minute/second strings for PrinterMonitor.format_time
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(60))
+
+
+def _is_log_only_frame(response) -> bool:
+    """True if a text frame only carries log-only topics (checked without parsing it)."""
+    if not isinstance(response, str) or '"sdcp/status/' in response:
+        return False
+    return any(marker in response for marker in _LOG_ONLY_TOPIC_MARKERS)
+
+
+# Used only for frames holding more than one JSON document
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _split_json_documents(text) -> List[Any]:
+    """Decode back-to-back JSON documents from one message (raises ValueError if malformed)."""
+    if isinstance(text, (bytes, bytearray)):
+        text = text.decode("utf-8")
+    documents = []
+    index, end = 0, len(text)
+    while True:
+        while index < end and text[index].isspace():
+            index += 1
+        if index == end:
+            return documents
+        document, index = _JSON_DECODER.raw_decode(text, index)
+        documents.append(document)
+
+
+@lru_cache(maxsize=128)
+def _parse_hms(text: str) -> Optional[int]:
+    """Parse an "hh:mm:ss" or "mm:ss" string into seconds (None if malformed)."""
+    time_parts = text.split(":")
+    try:
+        if len(time_parts) == 3:
+            hours, minutes, seconds = map(int, time_parts)
+            return hours * 3600 + minutes * 60 + seconds
+        if len(time_parts) == 2:
+            minutes, seconds = map(int, time_parts)
+            return minutes * 60 + seconds
+    except ValueError:
+        pass
+    return None
+
+
+def _time_field(data: Dict[str, Any], keys: Tuple[str, ...]) -> int:
+    """Seconds from the first alias in keys holding a positive number or "hh:mm:ss" string."""
+    result = 0
+    for key in keys:
+        value = data.get(key, _MISSING)
+        if value is _MISSING:
+            continue
+        try:
+            # Check if it's a string in "hh:mm:ss" format
+            if isinstance(value, str) and ":" in value:
+                seconds = _parse_hms(value)
+                if seconds is not None:
+                    result = seconds
+            else:
+                result = int(value)
+            if result > 0:
+                break
+        except (ValueError, TypeError):
+            pass
+    return result
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Printer:
     """Represents an Elegoo printer."""
     info: str = ""
@@ -65,20 +223,14 @@ class Printer:
     def __post_init__(self):
         """Parse printer info string if provided."""
         if self.info:
-            try:
-                parts = self.info.split("|")
-                if len(parts) >= 6:
-                    self.id = parts[0]
-                    self.name = parts[1]
-                    self.ip_address = parts[2]
-                    self.model = parts[3]
-                    self.firmware = parts[4]
-                    self.connection = "ElegooPrinterAPI"
-            except (ValueError, IndexError):
-                pass
+            # Only the first five fields are used; the rest stays unsplit
+            parts = self.info.split("|", 5)
+            if len(parts) == 6:
+                self.id, self.name, self.ip_address, self.model, self.firmware, _ = parts
+                self.connection = "ElegooPrinterAPI"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Temperature:
     """Printer temperature data."""
     uv_temp: float = 0.0
@@ -88,30 +240,35 @@ class Temperature:
         """Create instance from dictionary with flexible field mapping."""
         uv_temp = 0.0
         # Try different variations of UV temperature field
-        for field in ["UVTemp", "UV", "uv_temp", "UVTemperature", "LightTemp", "UVPanelTemp", "UVPanel"]:
-            if field in data:
-                try:
-                    uv_temp = float(data[field])
-                    break
-                except (ValueError, TypeError):
-                    pass
-        
+        for key in _UV_TEMP_FIELDS:
+            value = data.get(key, _MISSING)
+            if value is _MISSING:
+                continue
+            try:
+                uv_temp = float(value)
+                break
+            except (ValueError, TypeError):
+                pass
+
         # If we haven't found it, try looking for it nested in "UV" or similar
         if uv_temp == 0.0:
-            for parent_field in ["UV", "UVPanel", "Light"]:
-                if parent_field in data and isinstance(data[parent_field], dict):
-                    for child_field in ["Temp", "Temperature", "Value", "Current"]:
-                        if child_field in data[parent_field]:
-                            try:
-                                uv_temp = float(data[parent_field][child_field])
-                                break
-                            except (ValueError, TypeError):
-                                pass
-        
+            for parent_key in _UV_PARENT_FIELDS:
+                parent = data.get(parent_key)
+                if isinstance(parent, dict):
+                    for child_key in _UV_CHILD_FIELDS:
+                        value = parent.get(child_key, _MISSING)
+                        if value is _MISSING:
+                            continue
+                        try:
+                            uv_temp = float(value)
+                            break
+                        except (ValueError, TypeError):
+                            pass
+
         return cls(uv_temp=uv_temp)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PrintInfo:
     """Information about the current print job."""
     is_printing: bool = False
@@ -131,91 +288,62 @@ class PrintInfo:
         is_printing = False
         status_code = 0
         # Try different variations of IsPrinting field
-        for field in ["IsPrinting", "Printing", "isPrinting", "is_printing", "Status"]:
-            if field in data:
-                # If field is "Status", check if value is "Running" or similar
-                if field == "Status":
-                    if isinstance(data[field], str):
-                        is_printing = data[field].lower() in ["running", "printing", "busy"]
-                    elif isinstance(data[field], int):
-                        status_code = data[field]
-                        # Elegoo uses: 0,8=idle, 1=preparing, 2-4=printing, 7=finishing
-                        is_printing = status_code in [1, 2, 3, 4, 7]
-                else:
-                    is_printing = bool(data[field])
-                break
+        for key in _IS_PRINTING_FIELDS:
+            value = data.get(key, _MISSING)
+            if value is _MISSING:
+                continue
+            # If field is "Status", check if value is "Running" or similar
+            if key == "Status":
+                if isinstance(value, str):
+                    is_printing = value.lower() in _ACTIVE_STATUS_TEXTS
+                elif isinstance(value, int):
+                    status_code = value
+                    is_printing = status_code in _ACTIVE_STATUS_CODES
+            else:
+                is_printing = bool(value)
+            break
 
         # Try different variations of progress field
         progress = 0.0
-        for field in ["Progress", "progress", "PrintProgress", "print_progress", "Percent"]:
-            if field in data:
-                try:
-                    progress = float(data[field])
-                    break
-                except (ValueError, TypeError):
-                    pass
+        for key in _PROGRESS_FIELDS:
+            value = data.get(key, _MISSING)
+            if value is _MISSING:
+                continue
+            try:
+                progress = float(value)
+                break
+            except (ValueError, TypeError):
+                pass
 
         # Try different variations of current layer field
         current_layer = 0
-        for field in ["CurrentLayer", "Layer", "current_layer", "CurrentLine", "LineNum", "Layers"]:
-            if field in data:
-                try:
-                    current_layer = int(data[field])
-                    break
-                except (ValueError, TypeError):
-                    pass
+        for key in _CURRENT_LAYER_FIELDS:
+            value = data.get(key, _MISSING)
+            if value is _MISSING:
+                continue
+            try:
+                current_layer = int(value)
+                break
+            except (ValueError, TypeError):
+                pass
 
         # Try different variations of total layer field
         total_layer = 0
-        for field in ["TotalLayer", "TotalLayers", "MaxLayer", "Lines", "total_layers", "Slices"]:
-            if field in data:
-                try:
-                    total_layer = int(data[field])
-                    break
-                except (ValueError, TypeError):
-                    pass
+        for key in _TOTAL_LAYER_FIELDS:
+            value = data.get(key, _MISSING)
+            if value is _MISSING:
+                continue
+            try:
+                total_layer = int(value)
+                break
+            except (ValueError, TypeError):
+                pass
 
         # Try different variations of remaining time field (in seconds)
-        remain_time = 0
-        for field in ["RemainTime", "TimeLeft", "remain_time", "RemainingTime", "TimeRemaining", "PrintTimeLeft", "LeftTime", "remainTime", "leftTime"]:
-            if field in data:
-                try:
-                    # Check if it's a string in "hh:mm:ss" format
-                    if isinstance(data[field], str) and ":" in data[field]:
-                        time_parts = data[field].split(":")
-                        if len(time_parts) == 3:
-                            hours, minutes, seconds = map(int, time_parts)
-                            remain_time = hours * 3600 + minutes * 60 + seconds
-                        elif len(time_parts) == 2:
-                            minutes, seconds = map(int, time_parts)
-                            remain_time = minutes * 60 + seconds
-                    else:
-                        remain_time = int(data[field])
-                    if remain_time > 0:
-                        break
-                except (ValueError, TypeError):
-                    pass
+        remain_time = _time_field(data, _REMAIN_TIME_FIELDS)
 
         # Try different variations of total time field (in seconds)
-        total_time = 0
-        for field in ["TotalTime", "total_time", "TotalPrintTime", "PrintTime", "PrintDuration", "EstimatedTime", "totalTime", "printTime"]:
-            if field in data:
-                try:
-                    # Check if it's a string in "hh:mm:ss" format
-                    if isinstance(data[field], str) and ":" in data[field]:
-                        time_parts = data[field].split(":")
-                        if len(time_parts) == 3:
-                            hours, minutes, seconds = map(int, time_parts)
-                            total_time = hours * 3600 + minutes * 60 + seconds
-                        elif len(time_parts) == 2:
-                            minutes, seconds = map(int, time_parts)
-                            total_time = minutes * 60 + seconds
-                    else:
-                        total_time = int(data[field])
-                    if total_time > 0:
-                        break
-                except (ValueError, TypeError):
-                    pass
+        total_time = _time_field(data, _TOTAL_TIME_FIELDS)
 
         # Handle Ticks format (milliseconds) - used by Elegoo printers
         if total_time == 0 and "TotalTicks" in data:
@@ -234,16 +362,18 @@ class PrintInfo:
 
         # Try different variations of task ID field
         task_id = ""
-        for field in ["TaskID", "task_id", "JobID", "PrintID"]:
-            if field in data:
-                task_id = str(data[field])
+        for key in _TASK_ID_FIELDS:
+            value = data.get(key, _MISSING)
+            if value is not _MISSING:
+                task_id = str(value)
                 break
 
         # Try different variations of task name field
         task_name = ""
-        for field in ["TaskName", "task_name", "FileName", "JobName", "PrintName"]:
-            if field in data:
-                task_name = str(data[field])
+        for key in _TASK_NAME_FIELDS:
+            value = data.get(key, _MISSING)
+            if value is not _MISSING:
+                task_name = str(value)
                 break
 
         return cls(
@@ -259,29 +389,32 @@ class PrintInfo:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PrinterStatus:
     """Status of the printer."""
-    temperature: Temperature = None
-    print_info: PrintInfo = None
+    temperature: Temperature = field(default_factory=Temperature)
+    print_info: PrintInfo = field(default_factory=PrintInfo)
     status_code: int = 0
     status_text: str = "Unknown"
-    raw_data: dict = None
-
-    def __post_init__(self):
-        if self.temperature is None:
-            self.temperature = Temperature()
-        if self.print_info is None:
-            self.print_info = PrintInfo()
-        if self.raw_data is None:
-            self.raw_data = {}
+    raw_data: dict = field(default_factory=dict)
     
     @classmethod
     def from_json(cls, json_str: str) -> 'PrinterStatus':
         """Create instance from JSON string with flexible structure parsing."""
         try:
-            data = json.loads(json_str)
-            
+            data = _json_loads(json_str)
+        except ValueError as e:
+            monitor_logger.error(f"Error parsing printer status JSON: {e}")
+            monitor_logger.debug("Problematic JSON: %.200s...", json_str)
+            # Return a default status object
+            return cls()
+
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PrinterStatus':
+        """Create instance from an already decoded message with flexible structure parsing."""
+        try:
             # Try to extract print info and temperature using different possible paths
             print_info_data = {}
             temp_data = {}
@@ -337,24 +470,24 @@ class PrinterStatus:
             )
         
         except Exception as e:
-            logger = logging.getLogger("elegoo_monitor")
-            logger.error(f"Error parsing printer status JSON: {e}")
-            logger.debug(f"Problematic JSON: {json_str[:200]}...")
+            monitor_logger.error(f"Error parsing printer status data: {e}")
+            monitor_logger.debug("Problematic data: %.200s...", data)
             # Return a default status object
             return cls()
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PrinterData:
     """Container for all printer data."""
-    status: PrinterStatus = None
-    last_updated: str = ""
+    status: PrinterStatus = field(default_factory=PrinterStatus)
+    last_updated_ts: float = 0.0  # time.time() of the last update, 0 if never
 
-    def __post_init__(self):
-        if self.status is None:
-            self.status = PrinterStatus()
-        if not self.last_updated:
-            self.last_updated = ""
+    @property
+    def last_updated(self) -> str:
+        """Local time of the last update as "YYYY-MM-DD HH:MM:SS" (formatted when read)."""
+        if not self.last_updated_ts:
+            return ""
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.last_updated_ts))
 
 
 class ElegooPrinterClientWebsocketError(Exception):
@@ -379,6 +512,19 @@ class ElegooPrinterClient:
         self.printer_data = PrinterData()
         self.logger = logger
         self.connected = False
+        self._cmd_template: Optional[Dict[str, Any]] = None
+        # RequestIDs only correlate replies: a random per-client prefix plus a counter
+        self._request_prefix = secrets.token_hex(2)
+        self._request_ids = itertools.count(1)
+        # Set by _status_handler whenever a status message arrives
+        self._status_event = threading.Event()
+        # Handlers keyed by the second Topic segment (sdcp/<type>/<id>)
+        self._topic_handlers = {
+            "response": self._response_handler,
+            "status": self._status_handler,
+            "notice": self._notice_handler,
+            "error": self._error_handler,
+        }
         
     def get_printer_status(self) -> PrinterData:
         """Retrieves the printer status."""
@@ -386,35 +532,25 @@ class ElegooPrinterClient:
             self.logger.warning("Cannot get status: Not connected")
             return self.printer_data
             
+        self._status_event.clear()
         try:
             self._send_printer_cmd(0)
             
-            # On Elegoo printers, we may need additional commands to get complete data
-            # Send a few alternative commands to get more detailed status
-            try:
-                # Command for detailed printer status 
-                self._send_printer_cmd(100)  # Try alternative status command
-            except:
-                pass
-                
-            try:
-                # Command for print info
-                self._send_printer_cmd(200)  # Try print info command
-            except:
-                pass
-                
+            # On Elegoo printers, we may need additional commands to get complete data.
+            # They are optional, and a failed send means the socket is gone, so
+            # stop at the first failure rather than retrying each one.
             try:
-                # Command for temperature data
-                self._send_printer_cmd(300)  # Try temperature command
-            except:
-                pass
+                for cmd in _EXTRA_STATUS_CMDS:
+                    self._send_printer_cmd(cmd)
+            except Exception as e:
+                self.logger.debug(f"Optional status command failed: {e}")
                 
         except (ElegooPrinterClientWebsocketError, OSError):
             self.logger.exception("Error sending printer command")
             self.connected = False
             
-        # Add short delay to allow responses to be processed
-        time.sleep(0.2)
+        # Wait for the reply instead of sleeping a fixed amount
+        self._status_event.wait(CLIENT_STATUS_REPLY_TIMEOUT)
         
         return self.printer_data
 
@@ -423,24 +559,23 @@ class ElegooPrinterClient:
         if not self.connected:
             raise ElegooPrinterClientWebsocketConnectionError("Not connected")
             
-        ts = int(time.time())
-        data = data or {}
-        payload = {
-            "Id": self.printer.connection,
-            "Data": {
-                "Cmd": cmd,
-                "Data": data,
-                "RequestID": os.urandom(8).hex(),
-                "MainboardID": self.printer.id,
-                "TimeStamp": ts,
-                "From": 0,
-            },
-            "Topic": f"sdcp/request/{self.printer.id}",
-        }
+        # Sends come from both the asyncio loop and io_executor threads, so
+        # each one gets its own copy of the envelope (next() on the counter
+        # is atomic)
+        template = self._cmd_template
+        if template is None:
+            template = self._cmd_template = _new_cmd_template(self.printer)
+        payload = {**template, "Data": {
+            **template["Data"],
+            "Cmd": cmd,
+            "Data": data or _EMPTY_CMD_DATA,
+            "RequestID": f"{self._request_prefix}{next(self._request_ids):012x}",
+            "TimeStamp": int(time.time()),
+        }}
         
         if self.printer_websocket:
             try:
-                self.printer_websocket.send(json.dumps(payload))
+                self.printer_websocket.send(_json_dumps(payload))
             except (
                 websocket.WebSocketConnectionClosedException,
                 websocket.WebSocketException,
@@ -478,18 +613,24 @@ class ElegooPrinterClient:
                     self.logger.debug(f"Sending discovery message to {self.ip_address}:3000")
                     sock.sendto(msg, (self.ip_address, 3000))
                     
-                    # Try to receive a response
+                    # Read replies until a usable one arrives or the window closes
                     self.logger.debug("Waiting for response...")
-                    data, addr = sock.recvfrom(8192)
-                    self.logger.debug(f"Received response from {addr}")
-                    
-                    # Process the response
-                    printer = self._save_discovered_printer(data)
-                    if printer:
-                        self.logger.debug("Discovery done.")
-                        self.printer = printer
-                        return printer
-                except TimeoutError:
+                    deadline = time.monotonic() + DISCOVERY_TIMEOUT
+                    while True:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise socket.timeout()
+                        sock.settimeout(remaining)
+                        data, addr = sock.recvfrom(8192)
+                        self.logger.debug(f"Received response from {addr}")
+                        
+                        # Process the response
+                        printer = self._save_discovered_printer(data)
+                        if printer:
+                            self.logger.debug("Discovery done.")
+                            self.printer = printer
+                            return printer
+                except socket.timeout:
                     self.logger.warning("Printer discovery timed out.")
                 except Exception as e:
                     self.logger.warning(f"Socket error during discovery: {e}")
@@ -515,27 +656,22 @@ class ElegooPrinterClient:
             printer_info = data.decode("utf-8")
             self.logger.debug(f"Raw printer info: {printer_info!r}")
             
+            # Replies look like id|name|ip[|model|firmware]; skip anything else so
+            # discover_printer keeps waiting (fields past the fifth are unused)
+            parts = printer_info.split("|", 5)
+            if len(parts) < 3:
+                self.logger.debug("Ignoring discovery reply that is not id|name|ip")
+                return None
+            
             # Create a new printer instance
             printer = Printer()
-            
-            # Check if we have a valid response format
-            if "|" in printer_info:
-                # Try to parse the standard format
-                parts = printer_info.split("|")
-                if len(parts) >= 3:
-                    printer.id = parts[0]
-                    printer.name = parts[1]
-                    printer.ip_address = parts[2]
-                    if len(parts) >= 4:
-                        printer.model = parts[3]
-                    if len(parts) >= 5:
-                        printer.firmware = parts[4]
-            else:
-                # If we can't parse the standard format, at least set the IP
-                # This is a fallback that still allows us to attempt a connection
-                printer.name = "Elegoo Printer"
-                printer.ip_address = self.ip_address
-                printer.id = "ElegooPrinter"  # Fallback ID
+            printer.id = parts[0]
+            printer.name = parts[1]
+            printer.ip_address = parts[2]
+            if len(parts) >= 4:
+                printer.model = parts[3]
+            if len(parts) >= 5:
+                printer.firmware = parts[4]
             
             # Final validation - if we don't have an IP, use the one provided at initialization
             if not printer.ip_address:
@@ -567,6 +703,7 @@ class ElegooPrinterClient:
             
         url = f"ws://{self.printer.ip_address}:3030/websocket"
         self.logger.info(f"Connecting to: {self.printer.name} at {url}")
+        self._cmd_template = _new_cmd_template(self.printer)
 
         websocket.setdefaulttimeout(1)
         
@@ -630,41 +767,56 @@ class ElegooPrinterClient:
         self.connected = False
 
     def _parse_response(self, response: str) -> None:
+        # Skip decoding frames whose handlers would only log at DEBUG level
+        if not self.logger.isEnabledFor(logging.DEBUG) and _is_log_only_frame(response):
+            return
         try:
-            data = json.loads(response)
-            topic = data.get("Topic")
+            try:
+                messages = (_json_loads(response),)
+            except ValueError:
+                # Some firmwares send several JSON documents in one frame
+                messages = _split_json_documents(response)
+
+            for data in messages:
+                topic = data.get("Topic")
             
-            if topic:
-                topic_type = topic.split("/")[1] if len(topic.split("/")) > 1 else ""
-                if topic_type == "response":
-                    self._response_handler(data)
-                elif topic_type == "status":
-                    self._status_handler(data)
-                elif topic_type == "notice":
-                    self.logger.debug(f"notice >> {json.dumps(data)[:200]}")
-                elif topic_type == "error":
-                    self.logger.debug(f"error >> {json.dumps(data)[:200]}")
+                if topic:
+                    # Second segment of sdcp/<type>/<id>, without building a list
+                    topic_type = topic.partition("/")[2].partition("/")[0]
+                    handler = self._topic_handlers.get(topic_type)
+                    if handler:
+                        handler(data)
+                    else:
+                        self.logger.debug("Unknown message type: %s", topic_type)
                 else:
-                    self.logger.debug(f"Unknown message type: {topic_type}")
-            else:
-                # Even without a topic, the data might contain useful information
-                if "Data" in data or "StatusData" in data or "PrintInfo" in data:
-                    self.logger.debug("Message without Topic but contains data, attempting to parse")
-                    self._status_handler(data)
-        except json.JSONDecodeError:
+                    # Even without a topic, the data might contain useful information
+                    if "Data" in data or "StatusData" in data or "PrintInfo" in data:
+                        self.logger.debug("Message without Topic but contains data, attempting to parse")
+                        self._status_handler(data)
+        except ValueError:  # JSONDecodeError, or undecodable bytes
             self.logger.exception("Invalid JSON received")
 
     def _response_handler(self, data: Dict[str, Any]) -> None:
         self.logger.debug("Received response data")
 
+    def _notice_handler(self, data: Dict[str, Any]) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"notice >> {json.dumps(data)[:200]}")
+
+    def _error_handler(self, data: Dict[str, Any]) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"error >> {json.dumps(data)[:200]}")
+
     def _status_handler(self, data: Dict[str, Any]) -> None:
         """Handle printer status messages with debug logging."""
         try:
-            printer_status = PrinterStatus.from_json(json.dumps(data))
+            printer_status = PrinterStatus.from_dict(data)
             self.printer_data.status = printer_status
-            self.logger.debug(f"Updated printer status: Temperature={printer_status.temperature.uv_temp}°C, " + 
-                           f"Printing={printer_status.print_info.is_printing}, " +
-                           f"Progress={printer_status.print_info.progress}%")
+            self._status_event.set()
+            self.logger.debug("Updated printer status: Temperature=%s°C, Printing=%s, Progress=%s%%",
+                              printer_status.temperature.uv_temp,
+                              printer_status.print_info.is_printing,
+                              printer_status.print_info.progress)
         except Exception as e:
             self.logger.error(f"Error parsing printer status: {e}")
 
@@ -682,14 +834,27 @@ class PrinterMonitor:
         self.printer_websocket = None
         self.printer = Printer()
         self.printer_data = PrinterData()
+        self._cmd_template = None
+        # RequestIDs only correlate replies: a random per-monitor prefix plus a counter
+        self._request_prefix = secrets.token_hex(2)
+        self._request_ids = itertools.count(1)
+        # Set by _status_handler whenever a status message arrives
+        self._status_event = threading.Event()
+        # Handlers keyed by the second Topic segment (sdcp/<type>/<id>)
+        self._topic_handlers = {
+            "response": self._response_handler,
+            "status": self._status_handler,
+            "notice": self._notice_handler,
+            "error": self._error_handler,
+        }
         self.simulated_mode = False
-        logger = logging.getLogger("streamy.printmon")
+        # Optional callable(printer_data), called from the websocket thread on every status push
+        self.status_callback = None
         logger.info("PrinterMonitor initialized")
 
     def set_ip_address(self, ip_address):
         """Set the IP address for the printer connection"""
         self.ip_address = ip_address
-        logger = logging.getLogger("streamy.printmon")
         logger.info(f"Printer IP address set to: {ip_address}")
 
     async def connect(self):
@@ -698,7 +863,6 @@ class PrinterMonitor:
         Returns:
             bool: True if connected successfully, False otherwise
         """
-        logger = logging.getLogger("streamy.printmon")
         if not self.ip_address:
             logger.error("Cannot connect: No IP address provided")
             return False
@@ -742,7 +906,6 @@ class PrinterMonitor:
 
     def discover_printer(self):
         """Discover the Elegoo printer on the network."""
-        logger = logging.getLogger("streamy.printmon")
         logger.info(f"Starting printer discovery at {self.ip_address}")
         msg = b"M99999"
         try:
@@ -762,17 +925,23 @@ class PrinterMonitor:
                     logger.debug(f"Sending discovery message to {self.ip_address}:3000")
                     sock.sendto(msg, (self.ip_address, 3000))
 
-                    # Try to receive a response
+                    # Read replies until a usable one arrives or the window closes
                     logger.debug("Waiting for response...")
-                    data, addr = sock.recvfrom(8192)
-                    logger.debug(f"Received response from {addr}")
-
-                    # Process the response
-                    printer = self._save_discovered_printer(data)
-                    if printer:
-                        logger.debug("Discovery done.")
-                        return printer
-                except TimeoutError:
+                    deadline = time.monotonic() + DISCOVERY_TIMEOUT
+                    while True:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise socket.timeout()
+                        sock.settimeout(remaining)
+                        data, addr = sock.recvfrom(8192)
+                        logger.debug(f"Received response from {addr}")
+
+                        # Process the response
+                        printer = self._save_discovered_printer(data)
+                        if printer:
+                            logger.debug("Discovery done.")
+                            return printer
+                except socket.timeout:
                     logger.warning("Printer discovery timed out.")
                 except socket.error as e:
                     logger.warning(f"Socket error during discovery: {e}")
@@ -785,31 +954,26 @@ class PrinterMonitor:
 
     def _save_discovered_printer(self, data):
         """Parse and save discovered printer information."""
-        logger = logging.getLogger("streamy.printmon")
         try:
             printer_info = data.decode("utf-8")
             logger.debug(f"Raw printer info: {printer_info!r}")
 
+            # Replies look like id|name|ip[|model|firmware]; skip anything else so
+            # discover_printer keeps waiting (fields past the fifth are unused)
+            parts = printer_info.split("|", 5)
+            if len(parts) < 3:
+                logger.debug("Ignoring discovery reply that is not id|name|ip")
+                return None
+
             # Create a new printer instance
             printer = Printer()
-
-            # Check if we have a valid response format
-            if "|" in printer_info:
-                # Try to parse the standard format
-                parts = printer_info.split("|")
-                if len(parts) >= 3:
-                    printer.id = parts[0]
-                    printer.name = parts[1]
-                    printer.ip_address = parts[2]
-                    if len(parts) >= 4:
-                        printer.model = parts[3]
-                    if len(parts) >= 5:
-                        printer.firmware = parts[4]
-            else:
-                # If we can't parse the standard format, at least set the IP
-                printer.name = "Elegoo Printer"
-                printer.ip_address = self.ip_address
-                printer.id = "ElegooPrinter"
+            printer.id = parts[0]
+            printer.name = parts[1]
+            printer.ip_address = parts[2]
+            if len(parts) >= 4:
+                printer.model = parts[3]
+            if len(parts) >= 5:
+                printer.firmware = parts[4]
 
             # Final validation - if we don't have an IP, use the one provided at initialization
             if not printer.ip_address:
@@ -827,28 +991,29 @@ class PrinterMonitor:
         except Exception as e:
             logger.exception(f"Error creating Printer object: {e}")
 
-        # If all else fails, create a basic printer with the IP we know
-        fallback_printer = Printer()
-        fallback_printer.name = "Elegoo Printer"
-        fallback_printer.ip_address = self.ip_address
-        fallback_printer.id = "ElegooPrinter"
-        fallback_printer.connection = "ElegooPrinterAPI"
-        logger.warning(f"Using fallback printer configuration with IP: {self.ip_address}")
-        return fallback_printer
+        # connect() falls back to the known IP if no reply parses in time
+        return None
 
     async def connect_printer(self):
         """Connect to the Elegoo printer"""
-        logger = logging.getLogger("streamy.printmon")
         url = f"ws://{self.printer.ip_address}:3030/websocket"
         logger.info(f"Connecting to: {self.printer.name}")
+        # Request envelope template copied for every command sent on this connection
+        self._cmd_template = _new_cmd_template(self.printer)
 
         websocket.setdefaulttimeout(1)
 
+        # Set from the websocket thread once the handshake completes
+        loop = asyncio.get_running_loop()
+        opened = asyncio.Event()
+
         def ws_msg_handler(ws, msg):
             self._parse_response(msg)
 
         def ws_connected_handler(name):
             logger.info(f"Connected to: {name}")
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(opened.set)
 
         def on_close(ws, close_status_code, close_msg):
             logger.debug(f"Connection to {self.printer.name} closed: {close_msg} ({close_status_code})")
@@ -873,47 +1038,47 @@ class PrinterMonitor:
         thread.start()
 
         # Wait for connection to establish
-        start_time = time.time()
-        timeout = 5
-        while time.time() - start_time < timeout:
-            if ws.sock and ws.sock.connected:
-                await asyncio.sleep(1)
-                logger.info(f"Connected to {self.printer.name}")
-                self.is_connected = True
-                return True
-
-            await asyncio.sleep(0.1)
+        try:
+            await asyncio.wait_for(opened.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            logger.warning(f"Failed to connect to {self.printer.name} within timeout")
+            self.printer_websocket = None
+            return False
 
-        logger.warning(f"Failed to connect to {self.printer.name} within timeout")
-        self.printer_websocket = None
-        return False
+        await asyncio.sleep(1)
+        logger.info(f"Connected to {self.printer.name}")
+        self.is_connected = True
+        return True
 
     def _parse_response(self, response):
         """Parse the printer's WebSocket response"""
-        logger = logging.getLogger("streamy.printmon")
+        # Skip decoding frames whose handlers would only log at DEBUG level
+        if not logger.isEnabledFor(logging.DEBUG) and _is_log_only_frame(response):
+            return
         try:
-            data = json.loads(response)
-            topic = data.get("Topic")
-
-            if topic:
-                topic_type = topic.split("/")[1] if len(topic.split("/")) > 1 else ""
-                if topic_type == "response":
-                    self._response_handler(data)
-                elif topic_type == "status":
-                    self._status_handler(data)
-                elif topic_type == "notice":
-                    logger.debug(f"notice >> {json.dumps(data)[:100]}...")
-                elif topic_type == "error":
-                    logger.debug(f"error >> {json.dumps(data)[:100]}...")
-                else:
-                    logger.debug("Unknown message type")
-            else:
-                # Even without a topic, the data might contain useful information
-                if "Data" in data or "StatusData" in data or "PrintInfo" in data:
-                    logger.debug("Message without Topic but contains data, attempting to parse")
-                    self._status_handler(data)
+            try:
+                messages = (_json_loads(response),)
+            except ValueError:
+                # Some firmwares send several JSON documents in one frame
+                messages = _split_json_documents(response)
+
+            for data in messages:
+                topic = data.get("Topic")
+
+                if topic:
+                    # Second segment of sdcp/<type>/<id>, without building a list
+                    handler = self._topic_handlers.get(topic.partition("/")[2].partition("/")[0])
+                    if handler:
+                        handler(data)
+                    else:
+                        logger.debug("Unknown message type")
                 else:
-                    logger.debug("Message without Topic or useful data")
+                    # Even without a topic, the data might contain useful information
+                    if "Data" in data or "StatusData" in data or "PrintInfo" in data:
+                        logger.debug("Message without Topic but contains data, attempting to parse")
+                        self._status_handler(data)
+                    else:
+                        logger.debug("Message without Topic or useful data")
         except json.JSONDecodeError:
             logger.error(f"Invalid JSON received: {response[:100]}...")
         except Exception as e:
@@ -921,32 +1086,47 @@ class PrinterMonitor:
 
     def _response_handler(self, data):
         """Handle response messages."""
-        logger = logging.getLogger("streamy.printmon")
-        logger.debug(f"Response received: {json.dumps(data)[:200]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Response received: {json.dumps(data)[:200]}...")
+
+    def _notice_handler(self, data):
+        """Handle notice messages (only logged)."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"notice >> {json.dumps(data)[:100]}...")
+
+    def _error_handler(self, data):
+        """Handle error messages (only logged)."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"error >> {json.dumps(data)[:100]}...")
 
     def _status_handler(self, data):
         """Handle status messages from the printer."""
-        logger = logging.getLogger("streamy.printmon")
         try:
-            logger.debug(f"Status received: {json.dumps(data)[:200]}...")
-            # Parse the status using PrinterStatus
-            printer_status = PrinterStatus.from_json(json.dumps(data))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Status received: {json.dumps(data)[:200]}...")
+            # Parse the already decoded status using PrinterStatus
+            printer_status = PrinterStatus.from_dict(data)
 
             # Update printer data
             self.printer_data.status = printer_status
-            self.printer_data.last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.printer_data.last_updated_ts = time.time()
+            self._status_event.set()
 
             # Log status details
-            print_info = printer_status.print_info
-            logger.info(f"Updated status: Printing={print_info.is_printing}, " +
-                       f"Progress={print_info.progress:.1f}%, " +
-                       f"Layer={print_info.current_layer}/{print_info.total_layer}")
+            if logger.isEnabledFor(logging.INFO):
+                print_info = printer_status.print_info
+                logger.info(f"Updated status: Printing={print_info.is_printing}, " +
+                           f"Progress={print_info.progress:.1f}%, " +
+                           f"Layer={print_info.current_layer}/{print_info.total_layer}")
+
+            # Push the new status to any listener
+            if self.status_callback:
+                self.status_callback(self.printer_data)
         except Exception as e:
             logger.error(f"Error handling status message: {e}")
 
     def disconnect(self):
         """Disconnect from the printer"""
-        logger = logging.getLogger("streamy.printmon")
         try:
             if self.printer_websocket:
                 self.printer_websocket.close()
@@ -961,69 +1141,57 @@ class PrinterMonitor:
 
     def get_status(self):
         """Get the current printer status"""
-        logger = logging.getLogger("streamy.printmon")
         if not self.is_connected:
             logger.warning("Cannot get status: Not connected to printer")
             return None
 
+        self._status_event.clear()
         try:
             # Send status command and alternate commands
             self._send_printer_cmd(0)
 
-            # On Elegoo printers, we may need additional commands to get complete data
-            try:
-                # Command for detailed printer status
-                self._send_printer_cmd(100)
-            except:
-                pass
-
+            # On Elegoo printers, we may need additional commands to get complete data.
+            # They are optional, and a failed send means the socket is gone, so
+            # stop at the first failure rather than retrying each one.
             try:
-                # Command for print info
-                self._send_printer_cmd(200)
-            except:
-                pass
-
-            try:
-                # Command for temperature data
-                self._send_printer_cmd(300)
-            except:
-                pass
+                for cmd in _EXTRA_STATUS_CMDS:
+                    self._send_printer_cmd(cmd)
+            except Exception as e:
+                logger.debug(f"Optional status command failed: {e}")
 
-            # Add short delay to allow responses to be processed
-            time.sleep(0.2)
+            # Wait for the reply instead of sleeping a fixed amount
+            self._status_event.wait(STATUS_REPLY_TIMEOUT)
 
         except Exception as e:
             logger.error(f"Error sending printer commands: {e}")
 
         # Update timestamp if we have data
         if self.printer_data:
-            self.printer_data.last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.printer_data.last_updated_ts = time.time()
 
         return self.printer_data
 
     def _send_printer_cmd(self, cmd, data=None):
         """Send a command to the printer"""
-        logger = logging.getLogger("streamy.printmon")
-        ts = int(time.time())
-        data = data or {}
-        payload = {
-            "Id": self.printer.connection,
-            "Data": {
-                "Cmd": cmd,
-                "Data": data,
-                "RequestID": os.urandom(8).hex(),
-                "MainboardID": self.printer.id,
-                "TimeStamp": ts,
-                "From": 0,
-            },
-            "Topic": f"sdcp/request/{self.printer.id}",
-        }
-
-        logger.debug(f"Sending command {cmd} to printer")
+        # Sends come from both the asyncio loop and io_executor threads, so
+        # each one gets its own copy of the envelope (next() on the counter
+        # is atomic)
+        template = self._cmd_template
+        if template is None:
+            template = self._cmd_template = _new_cmd_template(self.printer)
+        payload = {**template, "Data": {
+            **template["Data"],
+            "Cmd": cmd,
+            "Data": data or _EMPTY_CMD_DATA,
+            "RequestID": f"{self._request_prefix}{next(self._request_ids):012x}",
+            "TimeStamp": int(time.time()),
+        }}
+
+        logger.debug("Sending command %s to printer", cmd)
 
         if self.printer_websocket and hasattr(self.printer_websocket, 'sock') and self.printer_websocket.sock and self.printer_websocket.sock.connected:
             try:
-                self.printer_websocket.send(json.dumps(payload))
+                self.printer_websocket.send(_json_dumps(payload))
             except Exception as e:
                 logger.error(f"Error sending command: {e}")
                 raise ElegooPrinterClientWebsocketError(f"WebSocket error: {e}")
@@ -1032,8 +1200,9 @@ class PrinterMonitor:
             raise ElegooPrinterClientWebsocketConnectionError("WebSocket not connected")
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def format_time(seconds):
-        """Format time in seconds to a readable string
+        """Format time in seconds to a readable string (cached per value)
 
         Args:
             seconds (int): Time in seconds
@@ -1041,11 +1210,10 @@ class PrinterMonitor:
         Returns:
             str: Formatted time string (HH:MM:SS)
         """
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
+        hours, rest = divmod(seconds, 3600)
+        minutes, secs = divmod(rest, 60)
 
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        return f"{hours:02d}:{_TWO_DIGITS[minutes]}:{_TWO_DIGITS[secs]}"
 
 # -----------------------------------------------------------------------------
 # Log Management Class
@@ -1104,7 +1272,7 @@ class LogManager:
             handlers=handlers
         )
         
-        self.logger = logging.getLogger("elegoo_monitor")
+        self.logger = monitor_logger
         self.logger.info("Log initialized")
         
     def get_logger(self):
@@ -1539,7 +1707,7 @@ class ElegooMonitorGUI:
 # -----------------------------------------------------------------------------
 
 def main():
-    if not _HAS_GUI:
+    if not _load_gui():
         print("Error: tkinter not available. Cannot run GUI.")
         return
 
@@ -9,12 +9,57 @@ import cv2
 import numpy as np
 from datetime import datetime
 import logging
+import threading
 import time
 import warnings
 
 # Configure logging
 logger = logging.getLogger("streamy.vidstream")
 
+# Hardware H.264 decoder segments to try with the GStreamer backend, in order of preference
+GST_HW_DECODERS = [
+    "nvv4l2decoder ! nvvideoconvert ! video/x-raw,format=BGRx",  # NVIDIA (NVDEC)
+    "vaapih264dec",                                               # Intel/AMD (VA-API)
+    "v4l2h264dec",                                                # Raspberry Pi (V4L2)
+    "vtdec",                                                      # macOS (VideoToolbox)
+]
+
+
+def _has_gstreamer():
+    """Check whether OpenCV was built with the GStreamer backend"""
+    try:
+        for line in cv2.getBuildInformation().splitlines():
+            if line.strip().startswith("GStreamer:"):
+                return "YES" in line
+    except Exception as e:
+        logger.error(f"Failed to read OpenCV build information: {e}")
+    return False
+
+
+def resize_to_fit(img, max_width, max_height, interpolation=None):
+    """Scale an image to fit a box while maintaining its aspect ratio
+
+    Args:
+        img (numpy.ndarray): Image to scale
+        max_width (int): Width of the box
+        max_height (int): Height of the box
+        interpolation (int, optional): OpenCV interpolation flag. Defaults to
+            INTER_AREA when shrinking and INTER_LINEAR when enlarging.
+
+    Returns:
+        numpy.ndarray: The scaled image, or img itself if it already fits exactly
+    """
+    h, w = img.shape[:2]
+    scale = min(max_width / w, max_height / h)
+    target_w, target_h = max(1, int(w * scale)), max(1, int(h * scale))
+    if (target_w, target_h) == (w, h):
+        return img
+
+    if interpolation is None:
+        interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+    return cv2.resize(img, (target_w, target_h), interpolation=interpolation)
+
+
 class VideoStreamer:
     """Class to handle video streaming from RTSP sources (Elegoo printers)"""
     
@@ -25,11 +70,28 @@ class VideoStreamer:
         self.is_running = False
         self.last_frame = None
 
+        # Capture thread and its single-slot "latest frame" buffer
+        self.timestamp_frames = True   # Whether the capture thread stamps displayed frames
+        self.rgb_frames = True         # Whether the capture thread converts displayed frames to RGB
+        self.display_size = None       # (width, height) the capture thread fits displayed frames into
+        self.display_interpolation = None  # OpenCV interpolation flag for that fit (None for the default)
+        self._capture_thread = None
+        self._capture_stop = None      # threading.Event that stops the current capture thread
+        self._capture_failed = False   # Set when the capture thread died on an error
+        self._frame_lock = threading.Lock()
+        self._latest_frame = None      # Newest decoded frame not yet taken by the display
+        self._frame_requested = True   # Whether the display is waiting for a new frame
+        self.frames_delivered = 0      # Frames handed to the display by get_latest()
+
         # RTSP settings
         self.transport = "udp"  # "udp" or "tcp"
         self.path = "/video"    # RTSP path (default: /video)
         self.port = 554         # RTSP port (default: 554)
 
+        # Decoding backend
+        self.gstreamer_available = _has_gstreamer()
+        self._gst_decoder = None   # Last GStreamer decoder that opened successfully
+
         # Suppress OpenCV error messages
         self._suppress_opencv_errors()
 
@@ -53,6 +115,14 @@ class VideoStreamer:
         try:
             # Approach 1: Use environment variables (works on all versions)
             os.environ["OPENCV_LOG_LEVEL"] = "ERROR"
+            # Quiet the FFmpeg and GStreamer backends' own logging (read when the
+            # first capture is opened) unless the user asked for it
+            os.environ.setdefault("OPENCV_FFMPEG_LOGLEVEL", "8")  # AV_LOG_FATAL
+            os.environ.setdefault("GST_DEBUG", "0")
+
+            # OpenCV reads OPENCV_LOG_LEVEL at import time, so set it directly too
+            if hasattr(cv2, "utils") and hasattr(cv2.utils, "logging"):
+                cv2.utils.logging.setLogLevel(cv2.utils.logging.LOG_LEVEL_ERROR)
             
             # Suppress Python warnings
             warnings.filterwarnings("ignore", category=UserWarning)
@@ -66,6 +136,70 @@ class VideoStreamer:
         """Set the IP address for the video stream"""
         self.ip_address = ip_address
     
+    def _build_gstreamer_pipeline(self, rtsp_url, decoder):
+        """Build a GStreamer pipeline string that decodes the RTSP stream with the given decoder
+
+        Args:
+            rtsp_url (str): The RTSP URL of the stream
+            decoder (str): Decoder segment of the pipeline (see GST_HW_DECODERS)
+
+        Returns:
+            str: Pipeline string for cv2.VideoCapture with cv2.CAP_GSTREAMER
+        """
+        return (
+            f"rtspsrc location={rtsp_url} protocols={self.transport} latency=100 "
+            f"! rtph264depay ! h264parse ! {decoder} "
+            f"! videoconvert ! video/x-raw,format=BGR "
+            f"! appsink drop=true max-buffers=1 sync=false"
+        )
+
+    def _open_capture(self, rtsp_url):
+        """Open the RTSP stream, preferring hardware decoding when available
+
+        Tries the GStreamer hardware decoders first (if OpenCV was built with
+        GStreamer), then falls back to the FFmpeg backend.
+
+        Args:
+            rtsp_url (str): The RTSP URL of the stream
+
+        Returns:
+            cv2.VideoCapture: The capture object (may not be opened)
+        """
+        if self.gstreamer_available:
+            # Try the last decoder that worked first to avoid re-probing on reconnect
+            decoders = list(GST_HW_DECODERS)
+            if self._gst_decoder in decoders:
+                decoders.remove(self._gst_decoder)
+                decoders.insert(0, self._gst_decoder)
+
+            for decoder in decoders:
+                pipeline = self._build_gstreamer_pipeline(rtsp_url, decoder)
+                cap = cv2.VideoCapture(pipeline, cv2.CAP_GSTREAMER)
+                if cap.isOpened():
+                    logger.info(f"Using GStreamer hardware decoder: {decoder}")
+                    self._gst_decoder = decoder
+                    return cap
+                cap.release()
+
+            logger.info("No GStreamer hardware decoder available, falling back to FFMPEG")
+
+        # Set environment variable for RTSP transport before creating capture
+        if self.transport == "tcp":
+            os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = "rtsp_transport;tcp"
+        else:
+            os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = "rtsp_transport;udp"
+
+        # Try to use FFMPEG backend if available
+        try:
+            if hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+                # Let FFMPEG pick any available hardware decoder (OpenCV 4.5.2+)
+                return cv2.VideoCapture(rtsp_url, cv2.CAP_FFMPEG, [
+                    cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+            return cv2.VideoCapture(rtsp_url, cv2.CAP_FFMPEG)
+        except Exception as e:
+            # Fallback for older OpenCV versions
+            return cv2.VideoCapture(rtsp_url)
+
     def connect(self):
         """Connect to the video stream"""
         if not self.ip_address:
@@ -80,35 +214,7 @@ class VideoStreamer:
             # Simple direct approach - minimize options for reliable connection
             cv2.setUseOptimized(True)
 
-            # Set environment variable for RTSP transport before creating capture
-            if self.transport == "tcp":
-                os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = "rtsp_transport;tcp"
-            else:
-                os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = "rtsp_transport;udp"
-
-            # Suppress FFMPEG output during connection
-            import sys
-            import contextlib
-
-            @contextlib.contextmanager
-            def suppress_stderr():
-                """Context manager to suppress stderr temporarily"""
-                stderr_fd = sys.stderr.fileno()
-                with os.fdopen(os.dup(stderr_fd), 'wb') as old_stderr:
-                    with open(os.devnull, 'wb') as devnull:
-                        os.dup2(devnull.fileno(), stderr_fd)
-                        try:
-                            yield
-                        finally:
-                            os.dup2(old_stderr.fileno(), stderr_fd)
-
-            # Try to use FFMPEG backend if available
-            with suppress_stderr():
-                try:
-                    self.cap = cv2.VideoCapture(rtsp_url, cv2.CAP_FFMPEG)
-                except Exception as e:
-                    # Fallback for older OpenCV versions
-                    self.cap = cv2.VideoCapture(rtsp_url)
+            self.cap = self._open_capture(rtsp_url)
 
             # Set additional capture properties for more stable streaming
             try:
@@ -138,6 +244,7 @@ class VideoStreamer:
                 time.sleep(0.3)  # Longer delay between retries
             
             if valid_frame:
+                self._start_capture_thread()
                 return True
                 
             # If we've tried multiple times and still no frame
@@ -155,51 +262,121 @@ class VideoStreamer:
     
     def disconnect(self):
         """Disconnect from the video stream"""
+        self.is_running = False
+
+        # Stop the capture thread; it releases the stream itself when it exits
+        if self._capture_stop is not None:
+            self._capture_stop.set()
+            self._capture_stop = None
+        thread = self._capture_thread
+        self._capture_thread = None
+        if thread is not None:
+            thread.join(timeout=2.0)
+            if thread.is_alive():
+                logger.warning("Capture thread still busy, stream will be released when it exits")
+
         if self.cap:
-            self.cap.release()
+            if thread is None or not thread.is_alive():
+                self.cap.release()
             self.cap = None
-        
-        self.is_running = False
+
         self.last_frame = None
+        with self._frame_lock:
+            self._latest_frame = None
+            self._frame_requested = True
         logger.info("Disconnected from video stream")
-    
-    def get_frame(self, add_timestamp=False):
-        """Get a frame from the video stream
-        
+
+    def _start_capture_thread(self):
+        """Start the background thread that reads frames from the stream"""
+        with self._frame_lock:
+            self._latest_frame = None
+            self._frame_requested = True
+        self._capture_failed = False
+
+        # Each thread gets its own stop event, so a thread still stuck in a blocking
+        # grab() after disconnect() can never pick up the next connection's stream
+        self._capture_stop = threading.Event()
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop, args=(self.cap, self._capture_stop),
+            name="streamy-capture", daemon=True)
+        self._capture_thread.start()
+
+    def _capture_loop(self, cap, stop):
+        """Read frames as fast as the stream delivers them (runs in the capture thread)
+
+        Every frame is grabbed so the stream never falls behind, but a frame is only
+        decoded when the display has taken the previous one. Only the newest decoded
+        frame is kept; older ones are dropped.
+
         Args:
-            add_timestamp (bool): Whether to add a timestamp to the frame
-            
-        Returns:
-            tuple: (success, frame) where success is a bool and frame is a numpy array
+            cap (cv2.VideoCapture): The capture object this thread reads from, released
+                when the loop exits
+            stop (threading.Event): Set by disconnect() to end this thread
         """
-        if not self.is_running or self.cap is None:
-            return False, None
-        
         try:
-            # Read frame from video stream
-            ret, frame = self.cap.read()
-            
-            if not ret or frame is None or frame.size == 0:
-                # If no frame but we have a last frame, use that
-                if self.last_frame is not None:
-                    frame = self.last_frame.copy()
-                    ret = True
-                else:
-                    return False, None
-            else:
-                # Successfully read frame, update last_frame
+            while not stop.is_set():
+                try:
+                    grabbed = cap.grab()
+                except Exception as e:
+                    logger.error(f"Error grabbing frame: {e}")
+                    grabbed = False
+                if not grabbed:
+                    # Stream hiccup - back off briefly instead of spinning
+                    time.sleep(0.01)
+                    continue
+
+                if not self._frame_requested:
+                    continue
+
+                ret, frame = cap.retrieve()
+                if not ret or frame is None or frame.size == 0 or stop.is_set():
+                    continue
                 self.last_frame = frame.copy()
-            
-            # Add timestamp if requested
-            if add_timestamp:
-                self.add_timestamp_to_frame(frame)
-            
-            return True, frame
-            
+
+                if self.timestamp_frames:
+                    self.add_timestamp_to_frame(frame)
+
+                # Prepare the frame for display here, off the GUI thread. Scaling
+                # first means the color conversion only touches displayed pixels.
+                display_size = self.display_size
+                if display_size:
+                    frame = resize_to_fit(frame, *display_size,
+                                          self.display_interpolation)
+                if self.rgb_frames and frame.ndim == 3:
+                    cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
+                with self._frame_lock:
+                    if stop.is_set():
+                        break
+                    self._latest_frame = frame
+                    self._frame_requested = False
         except Exception as e:
-            logger.error(f"Error getting frame: {e}")
+            logger.error(f"Error in capture thread: {e}")
+            # Report the dead stream through get_latest() unless it was already stopped
+            if not stop.is_set():
+                self._capture_failed = True
+        finally:
+            cap.release()
+
+    def get_latest(self):
+        """Take the newest frame decoded by the capture thread
+
+        Returns:
+            tuple: (success, frame) where success is False if the stream is not running
+                or the capture thread failed, and frame is None if no new frame was decoded since the last call.
+                The frame is handed over without copying, in RGB order if rgb_frames is set.
+        """
+        if not self.is_running or self._capture_failed:
             return False, None
-    
+
+        with self._frame_lock:
+            frame = self._latest_frame
+            self._latest_frame = None
+            self._frame_requested = True
+
+        if frame is not None:
+            self.frames_delivered += 1
+        return True, frame
+
     def add_timestamp_to_frame(self, frame):
         """Add timestamp to the frame
         
@@ -243,12 +420,13 @@ class VideoStreamer:
             return False, None
 
         try:
-            # Get current frame
-            success, frame = self.get_frame(add_timestamp=False)
+            # Get the last frame decoded by the capture thread
+            frame = self.last_frame
 
-            if not success or frame is None:
+            if frame is None:
                 logger.error("Failed to get frame for snapshot")
                 return False, None
+            frame = frame.copy()
 
             # Add timestamp if requested
             if add_timestamp: